@@ -1,29 +1,54 @@
 """ai_easy.py - Random move AI (no strategy)."""
 
-import random
+from random import getrandbits as _getrandbits
 from typing import List, Optional
 
+FULL_BOARD = 0x1FF  # All 9 cells occupied
+
+
+def _empty_mask(board: List[Optional[str]]) -> int:
+    """Pack the board's empty cells into a 9-bit mask (bit i == cell i)."""
+    mask = 0
+    for i, cell in enumerate(board):
+        if cell is None:
+            mask |= 1 << i
+    return mask
+
+
+def _pick_random_bit(mask: int) -> int:
+    """Return a uniformly random set-bit index from a non-zero mask."""
+    n = mask.bit_count()
+    if n > 1:
+        # Rejection-sample 4 random bits (cells number at most 9); this
+        # skips randrange's Python-level argument handling
+        k = _getrandbits(4)
+        while k >= n:
+            k = _getrandbits(4)
+        for _ in range(k):
+            mask &= mask - 1  # Drop the k lowest set bits
+    return (mask & -mask).bit_length() - 1
+
 
 def get_easy_move(board: List[Optional[str]]) -> Optional[int]:
     """Return a random empty position."""
-    empty = [i for i in range(9) if board[i] is None]
-    return random.choice(empty) if empty else None
+    mask = _empty_mask(board)
+    return _pick_random_bit(mask) if mask else None
 
 
 def get_easy_move_no_draw(board: List[Optional[str]], x_moves: list, o_moves: list) -> Optional[int]:
     """
     Return a random valid position for No Draw mode.
-    
+
     Valid moves are:
     - Any currently empty cell
     - The oldest O mark position, if O has >= 3 marks (will be removed before placement)
     """
-    empty = [i for i in range(9) if board[i] is None]
-    
+    mask = _empty_mask(board)
+
     # If O has 3 marks, oldest will be removed, so it becomes valid
     if len(o_moves) >= 3:
         oldest = o_moves[0]
         if board[oldest] == 'O':  # Still has O's mark (not overwritten by X yet)
-            empty.append(oldest)
-    
-    return random.choice(empty) if empty else None
+            mask |= 1 << oldest
+
+    return _pick_random_bit(mask) if mask else None
@@ -10,7 +10,9 @@ No-Draw variant uses alpha-beta pruning, dynamic depth limiting,
 move ordering, and state hashing to avoid freezes.
 """
 
+from array import array
 from collections import deque
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 WINNING_COMBINATIONS: List[Tuple[int, int, int]] = [
@@ -22,63 +24,209 @@ WINNING_COMBINATIONS: List[Tuple[int, int, int]] = [
 # Preferred move ordering: center → corners → edges (improves pruning)
 _MOVE_PRIORITY = [4, 0, 2, 6, 8, 1, 3, 5, 7]
 
+# Rank of each cell in _MOVE_PRIORITY, for O(1) sort keys
+_PRIORITY_RANK = {pos: rank for rank, pos in enumerate(_MOVE_PRIORITY)}
+
+# The winning combinations as 9-bit integer masks (bit i == cell i)
+_WIN_MASKS: Tuple[int, ...] = tuple(sum(1 << i for i in combo)
+                                    for combo in WINNING_COMBINATIONS)
+
+FULL_BOARD = 0x1FF  # All 9 cells occupied
+
+
+def _board_masks(board: List[Optional[str]]) -> Tuple[int, int]:
+    """Pack a list board into (x_mask, o_mask) 9-bit bitboards."""
+    x_mask = o_mask = 0
+    for i, cell in enumerate(board):
+        if cell == 'X':
+            x_mask |= 1 << i
+        elif cell == 'O':
+            o_mask |= 1 << i
+    return x_mask, o_mask
+
+
+def _mask_wins(m: int) -> bool:
+    """True if the occupancy mask contains a complete line.
+
+    Hand-unrolled over the 8 line masks: a chain of AND/EQ ops avoids
+    creating a generator per call, which matters in the search loops.
+    """
+    return ((m & 7) == 7 or (m & 56) == 56 or (m & 448) == 448
+            or (m & 73) == 73 or (m & 146) == 146 or (m & 292) == 292
+            or (m & 273) == 273 or (m & 84) == 84)
+
 
 def check_winner(board: List[Optional[str]], player: str) -> bool:
     """Check if player has won."""
-    return any(all(board[i] == player for i in combo) for combo in WINNING_COMBINATIONS)
+    mask = 0
+    for i, cell in enumerate(board):
+        if cell == player:
+            mask |= 1 << i
+    return _mask_wins(mask)
 
 
 def is_board_full(board: List[Optional[str]]) -> bool:
     """Check if board is full."""
-    return all(cell is not None for cell in board)
+    return None not in board
 
 
-def minimax(board: List[Optional[str]], depth: int, is_maximizing: bool) -> int:
-    """
-    Minimax algorithm: returns optimal score for current board state.
-    Depth adjustment makes AI prefer faster wins / slower losses.
+@lru_cache(maxsize=None)
+def _minimax_bits(x_mask: int, o_mask: int, depth: int,
+                  is_maximizing: bool) -> int:
+    """Bitboard core of minimax: pure integer state, no list mutation.
+
+    Cached on the full argument tuple, so every transposition — the
+    same position reached through different move orders — is solved
+    exactly once per depth and then served from the table. The cache
+    never needs clearing: scores depend only on the key. With it in
+    place, exhaustive search touches each state once, which beats
+    alpha-beta pruning (whose bound-dependent results would not be
+    cacheable).
     """
-    if check_winner(board, 'O'):
+    # Only the side that just moved — the minimizer's opponent — can
+    # have completed a line, so one win test per node suffices
+    if is_maximizing:
+        if _mask_wins(x_mask):
+            return depth - 10
+    elif _mask_wins(o_mask):
         return 10 - depth
-    if check_winner(board, 'X'):
-        return depth - 10
-    if is_board_full(board):
+    occupied = x_mask | o_mask
+    if occupied == FULL_BOARD:
         return 0
 
-    empty = [i for i in range(9) if board[i] is None]
+    empty = ~occupied & FULL_BOARD
 
     if is_maximizing:
         best = float('-inf')
-        for pos in empty:
-            board[pos] = 'O'
-            best = max(best, minimax(board, depth + 1, False))
-            board[pos] = None
+        m = empty
+        while m:
+            bit = m & -m
+            m ^= bit
+            best = max(best, _minimax_bits(x_mask, o_mask | bit,
+                                           depth + 1, False))
         return best
     else:
         best = float('inf')
-        for pos in empty:
-            board[pos] = 'X'
-            best = min(best, minimax(board, depth + 1, True))
-            board[pos] = None
+        m = empty
+        while m:
+            bit = m & -m
+            m ^= bit
+            best = min(best, _minimax_bits(x_mask | bit, o_mask,
+                                           depth + 1, True))
         return best
 
 
+def minimax(board: List[Optional[str]], depth: int, is_maximizing: bool) -> int:
+    """
+    Minimax: returns optimal score for current board state.
+    Depth adjustment makes AI prefer faster wins / slower losses.
+    """
+    x_mask, o_mask = _board_masks(board)
+    return _minimax_bits(x_mask, o_mask, depth, is_maximizing)
+
+
+def _build_policy() -> dict:
+    """Solve every O-to-move position once and record the best move.
+
+    Tic-tac-toe has few enough states (at most 3^9) that the whole
+    game can be solved at import: a memoized full minimax over
+    (x_mask, o_mask, side) visits each state once, and the argmax
+    O-move is stored for every position where O could be asked to
+    play. Depth adjustment uses the absolute mark count, which
+    preserves the same move choices as the per-call search.
+    """
+    memo: dict = {}
+
+    def solve(x_mask: int, o_mask: int, is_maximizing: bool) -> int:
+        # As in _minimax_bits, only the previous mover can have won
+        if is_maximizing:
+            if _mask_wins(x_mask):
+                return (x_mask | o_mask).bit_count() - 10
+        elif _mask_wins(o_mask):
+            return 10 - (x_mask | o_mask).bit_count()
+        occupied = x_mask | o_mask
+        if occupied == FULL_BOARD:
+            return 0
+
+        key = (x_mask << 10) | (o_mask << 1) | is_maximizing
+        score = memo.get(key)
+        if score is not None:
+            return score
+
+        m = ~occupied & FULL_BOARD
+        if is_maximizing:
+            score = float('-inf')
+            while m:
+                bit = m & -m
+                m ^= bit
+                score = max(score, solve(x_mask, o_mask | bit, False))
+        else:
+            score = float('inf')
+            while m:
+                bit = m & -m
+                m ^= bit
+                score = min(score, solve(x_mask | bit, o_mask, True))
+        memo[key] = score
+        return score
+
+    policy = {}
+    for x_mask in range(FULL_BOARD + 1):
+        for o_mask in range(FULL_BOARD + 1):
+            if x_mask & o_mask:
+                continue
+            x_n = x_mask.bit_count()
+            o_n = o_mask.bit_count()
+            # O moves either second (X ahead by one) or first (even)
+            if x_n - o_n not in (0, 1):
+                continue
+            if _mask_wins(x_mask) or _mask_wins(o_mask):
+                continue
+            empty = ~(x_mask | o_mask) & FULL_BOARD
+            if not empty:
+                continue
+
+            best_score = float('-inf')
+            best_move = (empty & -empty).bit_length() - 1
+            m = empty
+            while m:
+                bit = m & -m
+                m ^= bit
+                score = solve(x_mask, o_mask | bit, False)
+                if score > best_score:
+                    best_score = score
+                    best_move = bit.bit_length() - 1
+            policy[(x_mask << 9) | o_mask] = best_move
+    return policy
+
+
+_POLICY: dict = _build_policy()
+
+
 def get_hard_move(board: List[Optional[str]]) -> Optional[int]:
-    """Return optimal move using Minimax algorithm."""
-    empty = [i for i in range(9) if board[i] is None]
+    """Return optimal move from the precomputed policy table."""
+    x_mask, o_mask = _board_masks(board)
+    empty = ~(x_mask | o_mask) & FULL_BOARD
     if not empty:
         return None
 
-    best_score = float('-inf')
-    best_move = empty[0]
+    move = _POLICY.get((x_mask << 9) | o_mask)
+    if move is not None:
+        return move
 
-    for pos in empty:
-        board[pos] = 'O'
-        score = minimax(board, 0, False)
-        board[pos] = None
+    # Fallback search for states outside the precomputed turn pattern
+    best_score = float('-inf')
+    best_move = (empty & -empty).bit_length() - 1
+
+    # Bit ripple walks candidates in ascending cell order, matching the
+    # old list iteration so tie-breaks are unchanged
+    m = empty
+    while m:
+        bit = m & -m
+        m ^= bit
+        score = _minimax_bits(x_mask, o_mask | bit, 0, False)
         if score > best_score:
             best_score = score
-            best_move = pos
+            best_move = bit.bit_length() - 1
 
     return best_move
 
@@ -87,8 +235,32 @@ def get_hard_move(board: List[Optional[str]]) -> Optional[int]:
 
 MAX_MARKS = 3
 
-# Transposition table cleared each top-level call
-_tp_table: dict = {}
+# Transposition table: fixed-size open-addressed cache (direct-mapped
+# with linear probing) in two flat arrays instead of a dict, so probing
+# is pure array indexing with no per-entry PyObject allocation. Keys
+# hold the packed canonical state (-1 = empty slot); values pack
+# (remaining_depth, score, best_move, bound) into one int:
+#   bits 0-1 bound, 2-5 best_move + 1 (0 = none),
+#   6-13 score + 128, 14+ remaining depth.
+# Sized well above per-call entry counts, and wiped by slice-assigning
+# a blank template (one memcpy) each top-level call.
+_TP_SIZE = 32768  # power of two so `key & _TP_MASK` replaces modulo
+_TP_MASK = _TP_SIZE - 1
+_TP_BLANK_KEYS = array('q', [-1]) * _TP_SIZE
+_tp_keys = array('q', _TP_BLANK_KEYS)
+_tp_vals = array('i', [0]) * _TP_SIZE
+
+# TT bound types: score is exact, a lower bound (cutoff), or an upper bound
+_EXACT, _LOWER, _UPPER = 0, 1, 2
+
+# Killer moves: the last two cutoff moves per ply, tried early on
+# sibling nodes. Reset alongside the transposition table each
+# top-level call.
+_killers: List[List[int]] = [[-1, -1] for _ in range(16)]
+
+# History heuristic: (player, pos) -> cutoff weight, heavier for
+# cutoffs found with more depth remaining
+_history: dict = {}
 
 
 def _get_dynamic_depth(board: List[Optional[str]]) -> int:
@@ -99,50 +271,131 @@ def _get_dynamic_depth(board: List[Optional[str]]) -> int:
     """
     empty = sum(1 for c in board if c is None)
     if empty >= 7:
-        return 4
+        return 6
     if empty >= 5:
-        return 5
-    return 6
+        return 8
+    return 12
 
 
 def _order_moves(moves: List[int]) -> List[int]:
-    """Sort moves by strategic priority for better alpha-beta pruning."""
-    return sorted(moves, key=lambda m: _MOVE_PRIORITY.index(m)
-                  if m in _MOVE_PRIORITY else 9)
+    """Sort moves by strategic priority for better alpha-beta pruning.
 
+    _PRIORITY_RANK covers all nine cells, so its bound __getitem__ is
+    the whole key function — no lambda frame or linear index() scan.
+    """
+    return sorted(moves, key=_PRIORITY_RANK.__getitem__)
 
-def _board_key(board: List[Optional[str]], x_moves: list,
-               o_moves: list, is_maximizing: bool) -> tuple:
-    """Create a hashable key for the transposition table."""
-    return (tuple(board), tuple(x_moves), tuple(o_moves), is_maximizing)
 
+def _build_symmetries() -> List[Tuple[int, ...]]:
+    """Return the 8 dihedral symmetries of the board as cell permutations.
 
-def _get_available_moves_no_draw(board: List[Optional[str]], player: str,
+    Each permutation p maps cell i to p[i] on the transformed board.
+    """
+    def _rot(i: int) -> int:  # 90° clockwise: (r, c) -> (c, 2 - r)
+        r, c = divmod(i, 3)
+        return c * 3 + (2 - r)
+
+    def _flip(i: int) -> int:  # horizontal mirror: (r, c) -> (r, 2 - c)
+        r, c = divmod(i, 3)
+        return r * 3 + (2 - c)
+
+    perms = []
+    perm = tuple(range(9))
+    for _ in range(4):
+        perms.append(perm)
+        perms.append(tuple(_flip(j) for j in perm))
+        perm = tuple(_rot(j) for j in perm)
+    return perms
+
+
+_SYM_PERMS: List[Tuple[int, ...]] = _build_symmetries()
+
+# Inverse permutations, to map a canonical-frame cell back to the original
+_SYM_INV: List[Tuple[int, ...]] = []
+for _perm in _SYM_PERMS:
+    _inv = [0] * 9
+    for _i, _j in enumerate(_perm):
+        _inv[_j] = _i
+    _SYM_INV.append(tuple(_inv))
+
+# Per-symmetry lookup: transformed value of every 9-bit mask
+_PERM_MASKS: List[List[int]] = []
+for _perm in _SYM_PERMS:
+    _table = [0] * (FULL_BOARD + 1)
+    for _mask in range(FULL_BOARD + 1):
+        _t = 0
+        for _i in range(9):
+            if (_mask >> _i) & 1:
+                _t |= 1 << _perm[_i]
+        _table[_mask] = _t
+    _PERM_MASKS.append(_table)
+
+
+def _canonical_key(x_mask: int, o_mask: int, x_moves, o_moves,
+                   is_maximizing: bool) -> Tuple[int, int]:
+    """Pack the search state into its canonical integer key.
+
+    The full state — bitboards plus both FIFO queues — is packed into
+    one int under each of the 8 board symmetries, and the smallest key
+    wins, so mirrored and rotated transpositions share one table entry.
+    Queue digits are appended base-10 behind a leading 1 so queues of
+    different lengths can never collide (e.g. [1, 2] -> 112 while
+    [0, 1, 2] -> 1012). Returns (key, symmetry index); stored moves are
+    in the canonical frame and must be mapped back via _SYM_INV.
+    """
+    best_key = -1
+    best_sym = 0
+    for sym in range(8):
+        table = _PERM_MASKS[sym]
+        perm = _SYM_PERMS[sym]
+        xq = 1
+        for pos in x_moves:
+            xq = xq * 10 + perm[pos]
+        oq = 1
+        for pos in o_moves:
+            oq = oq * 10 + perm[pos]
+        key = ((((table[x_mask] << 9) | table[o_mask]) << 23)
+               | (xq << 12) | (oq << 1) | is_maximizing)
+        if best_key < 0 or key < best_key:
+            best_key, best_sym = key, sym
+    return best_key, best_sym
+
+
+def _get_available_moves_no_draw(x_mask: int, o_mask: int,
                                   player_moves: list) -> List[int]:
     """
     Get available moves for a player in No Draw mode.
     If the player has 3 marks, the oldest will be removed,
     so that cell also becomes available.
+
+    The search already threads the bitboards through every node, so
+    candidates come straight off the masks with a bit ripple — no
+    9-cell board scan or membership test per node.
     """
-    available = [i for i in range(9) if board[i] is None]
+    avail_mask = ~(x_mask | o_mask) & FULL_BOARD
     if len(player_moves) >= MAX_MARKS:
-        oldest = player_moves[0]
-        if oldest not in available:
-            available.append(oldest)
+        avail_mask |= 1 << player_moves[0]
+    available = []
+    m = avail_mask
+    while m:
+        bit = m & -m
+        m ^= bit
+        available.append(bit.bit_length() - 1)
     return _order_moves(available)
 
 
-def _heuristic_score(board: List[Optional[str]]) -> int:
+def _heuristic_score(x_mask: int, o_mask: int) -> int:
     """Quick heuristic when depth limit reached.
-    
-    Counts how many winning lines each player threatens.
+
+    Counts how many winning lines each player threatens, straight off
+    the bitboards: one AND plus a popcount per line and player instead
+    of building a 3-cell list and scanning it with .count().
     """
     o_score = 0
     x_score = 0
-    for combo in WINNING_COMBINATIONS:
-        vals = [board[i] for i in combo]
-        o_count = vals.count('O')
-        x_count = vals.count('X')
+    for w in _WIN_MASKS:
+        o_count = (o_mask & w).bit_count()
+        x_count = (x_mask & w).bit_count()
         if x_count == 0 and o_count > 0:
             o_score += o_count
         if o_count == 0 and x_count > 0:
@@ -150,97 +403,151 @@ def _heuristic_score(board: List[Optional[str]]) -> int:
     return o_score - x_score
 
 
-def minimax_no_draw(board: List[Optional[str]], depth: int, is_maximizing: bool,
+def minimax_no_draw(board: List[Optional[str]], x_mask: int, o_mask: int,
+                     depth: int, is_maximizing: bool,
                      x_moves: list, o_moves: list, max_depth: int,
                      alpha: float = float('-inf'),
                      beta: float = float('inf')) -> int:
     """
-    Minimax with alpha-beta pruning for No Draw mode.
+    Negamax with alpha-beta pruning for No Draw mode.
     Simulates mark removal (FIFO) when a player already has 3 marks.
     Uses transposition table and heuristic evaluation at depth limit.
+
+    Scores are from the perspective of the side to move (O when
+    is_maximizing is True): one search loop with score = -recurse(...)
+    and a (-beta, -alpha) child window replaces the two near-identical
+    max/min branches. Callers negate the result accordingly.
+
+    x_moves/o_moves are deques mutated in place with the make/undo
+    pattern; every branch restores them before returning. x_mask and
+    o_mask mirror the board as bitboards, maintained incrementally so
+    the transposition key never has to rescan the board.
     """
-    if check_winner(board, 'O'):
-        return 10 - depth
-    if check_winner(board, 'X'):
+    # Only the opponent — the side that just moved — can have won here;
+    # the mover's own wins are caught before recursing. Their win is a
+    # loss from the side to move's perspective either way.
+    if _mask_wins(x_mask if is_maximizing else o_mask):
         return depth - 10
-    if depth >= max_depth:
-        return _heuristic_score(board)
-
-    # Transposition table lookup
-    key = _board_key(board, x_moves, o_moves, is_maximizing)
-    if key in _tp_table:
-        return _tp_table[key]
+    remaining = max_depth - depth
+    if remaining <= 0:
+        score = _heuristic_score(x_mask, o_mask)
+        return score if is_maximizing else -score
+
+    # Transposition table probe: entries searched at least as deep can
+    # answer directly; shallower ones still seed move ordering
+    key, sym = _canonical_key(x_mask, o_mask, x_moves, o_moves, is_maximizing)
+    idx = key & _TP_MASK
+    slot = _tp_keys[idx]
+    while slot != -1 and slot != key:
+        idx = (idx + 1) & _TP_MASK
+        slot = _tp_keys[idx]
+    tt_move = -1
+    if slot == key:
+        packed = _tp_vals[idx]
+        e_move = ((packed >> 2) & 15) - 1
+        if e_move >= 0:
+            # Stored in the canonical frame; map back to this board
+            tt_move = _SYM_INV[sym][e_move]
+        if (packed >> 14) >= remaining:
+            e_score = ((packed >> 6) & 255) - 128
+            e_bound = packed & 3
+            if e_bound == _EXACT:
+                return e_score
+            if e_bound == _LOWER and e_score >= beta:
+                return e_score
+            if e_bound == _UPPER and e_score <= alpha:
+                return e_score
 
     if is_maximizing:
         player = 'O'
         player_moves = o_moves
+        own_mask = o_mask
     else:
         player = 'X'
         player_moves = x_moves
+        own_mask = x_mask
 
-    available = _get_available_moves_no_draw(board, player, player_moves)
+    available = _get_available_moves_no_draw(x_mask, o_mask, player_moves)
 
     if not available:
-        return _heuristic_score(board)
-
-    if is_maximizing:
-        best = float('-inf')
-        for pos in available:
-            removed = None
-            new_moves = list(player_moves)
-            if len(new_moves) >= MAX_MARKS:
-                removed = new_moves.pop(0)
-                board[removed] = None
-
-            board[pos] = player
-            new_moves.append(pos)
+        score = _heuristic_score(x_mask, o_mask)
+        return score if is_maximizing else -score
+
+    # Killer and history ordering: moves that recently caused cutoffs at
+    # this ply (or anywhere, weighted) are likely to cut here too. The
+    # sort is stable, so static priority remains the final tie-break.
+    killers = _killers[depth]
+    hist = _history
+    available.sort(key=lambda pos: (pos != killers[0] and pos != killers[1],
+                                    -hist.get((player, pos), 0)))
+
+    # Principal variation first: the previous iteration's best move for
+    # this node usually causes an immediate cutoff
+    if tt_move >= 0 and tt_move in available:
+        available.remove(tt_move)
+        available.insert(0, tt_move)
+
+    orig_alpha = alpha
+    best_move = -1
+    best = float('-inf')
 
-            if check_winner(board, player):
-                score = 10 - depth
-            else:
-                score = minimax_no_draw(board, depth + 1, False,
-                                         x_moves, new_moves, max_depth,
-                                         alpha, beta)
+    for pos in available:
+        # Make the move in place (O(1) deque ops), recurse, undo —
+        # no per-branch list copies
+        removed = None
+        new_own = own_mask
+        if len(player_moves) >= MAX_MARKS:
+            removed = player_moves.popleft()
+            board[removed] = None
+            new_own &= ~(1 << removed)
+
+        board[pos] = player
+        player_moves.append(pos)
+        new_own |= 1 << pos
+
+        if _mask_wins(new_own):
+            # The mover wins immediately: best possible from our side
+            score = 10 - depth
+        elif is_maximizing:
+            score = -minimax_no_draw(board, x_mask, new_own, depth + 1,
+                                      False, x_moves, o_moves, max_depth,
+                                      -beta, -alpha)
+        else:
+            score = -minimax_no_draw(board, new_own, o_mask, depth + 1,
+                                      True, x_moves, o_moves, max_depth,
+                                      -beta, -alpha)
 
-            board[pos] = None
-            if removed is not None:
-                board[removed] = player
+        player_moves.pop()
+        board[pos] = None
+        if removed is not None:
+            player_moves.appendleft(removed)
+            board[removed] = player
 
-            best = max(best, score)
-            alpha = max(alpha, best)
-            if beta <= alpha:
-                break
-        _tp_table[key] = best
-        return best
+        if score > best:
+            best = score
+            best_move = pos
+        if best > alpha:
+            alpha = best
+        if alpha >= beta:
+            if pos != killers[0]:
+                killers[1] = killers[0]
+                killers[0] = pos
+            hist[(player, pos)] = (hist.get((player, pos), 0)
+                                   + remaining * remaining)
+            break
+
+    if best <= orig_alpha:
+        bound = _UPPER
+    elif best >= beta:
+        bound = _LOWER
     else:
-        best = float('inf')
-        for pos in available:
-            removed = None
-            new_moves = list(player_moves)
-            if len(new_moves) >= MAX_MARKS:
-                removed = new_moves.pop(0)
-                board[removed] = None
-
-            board[pos] = player
-            new_moves.append(pos)
-
-            if check_winner(board, player):
-                score = depth - 10
-            else:
-                score = minimax_no_draw(board, depth + 1, True,
-                                         new_moves, o_moves, max_depth,
-                                         alpha, beta)
-
-            board[pos] = None
-            if removed is not None:
-                board[removed] = player
-
-            best = min(best, score)
-            beta = min(beta, best)
-            if beta <= alpha:
-                break
-        _tp_table[key] = best
-        return best
+        bound = _EXACT
+    # idx is the matching slot or the first empty one in the probe chain
+    canon_move = _SYM_PERMS[sym][best_move] + 1 if best_move >= 0 else 0
+    _tp_keys[idx] = key
+    _tp_vals[idx] = ((remaining << 14) | ((best + 128) << 6)
+                     | (canon_move << 2) | bound)
+    return best
 
 
 def get_hard_move_no_draw(board: List[Optional[str]], x_moves: list,
@@ -250,51 +557,65 @@ def get_hard_move_no_draw(board: List[Optional[str]], x_moves: list,
     Uses Minimax with alpha-beta pruning, dynamic depth,
     move ordering, and transposition table.
     """
-    global _tp_table
-    _tp_table = {}  # Clear cache each top-level call
+    _tp_keys[:] = _TP_BLANK_KEYS  # Clear cache each top-level call
+    for killer in _killers:
+        killer[0] = killer[1] = -1
+    _history.clear()
+
+    x_queue = deque(x_moves)
+    o_queue = deque(o_moves)
+    x_mask, o_mask = _board_masks(board)
 
-    available = _get_available_moves_no_draw(board, 'O', o_moves)
+    available = _get_available_moves_no_draw(x_mask, o_mask, o_queue)
 
     if not available:
         return None
 
     # Fast path: take an immediate win before running expensive minimax
+    o_removed = ~(1 << o_queue[0]) if len(o_queue) >= MAX_MARKS else ~0
     for pos in available:
-        removed = None
-        sim_moves = list(o_moves)
-        if len(sim_moves) >= MAX_MARKS:
-            removed = sim_moves.pop(0)
-            board[removed] = None
-        board[pos] = 'O'
-        won = check_winner(board, 'O')
-        board[pos] = None
-        if removed is not None:
-            board[removed] = 'O'
-        if won:
+        if _mask_wins((o_mask & o_removed) | (1 << pos)):
             return pos
 
     max_depth = _get_dynamic_depth(board)
-    best_score = float('-inf')
     best_move = available[0]
-    alpha = float('-inf')
-    beta = float('inf')
 
-    for pos in available:
-        removed = None
-        new_o_moves = list(o_moves)
-        if len(new_o_moves) >= MAX_MARKS:
-            removed = new_o_moves.pop(0)
-            board[removed] = None
+    # Iterative deepening: each pass leaves (score, move, bound) entries
+    # in the transposition table, so the next pass searches previous
+    # best moves first and prunes far more aggressively. The root keeps
+    # its static priority order so tie-breaks stay deterministic.
+    for target_depth in range(1, max_depth + 1):
+        best_score = float('-inf')
 
-        board[pos] = 'O'
-        new_o_moves.append(pos)
+        for pos in available:
+            removed = None
+            new_o = o_mask
+            if len(o_queue) >= MAX_MARKS:
+                removed = o_queue.popleft()
+                board[removed] = None
+                new_o &= ~(1 << removed)
 
-        if check_winner(board, 'O'):
-            score = 10
-        else:
-            score = minimax_no_draw(board, 0, False, x_moves, new_o_moves,
-                                     max_depth, alpha, beta)
+            board[pos] = 'O'
+            o_queue.append(pos)
+            new_o |= 1 << pos
+
+            if _mask_wins(new_o):
+                score = 10
+            else:
+                # Negamax child: X to move, window negated around the
+                # root aspiration (alpha = best so far, beta = +inf)
+                score = -minimax_no_draw(board, x_mask, new_o, 0, False,
+                                          x_queue, o_queue, target_depth,
+                                          float('-inf'), -best_score)
+
+            o_queue.pop()
+            board[pos] = None
+            if removed is not None:
+                o_queue.appendleft(removed)
+                board[removed] = 'O'
+
+            if score > best_score:
+                best_score = score
+                best_move = pos
 
-        alpha = max(alpha, best_score)
-    
     return best_move
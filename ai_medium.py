@@ -1,61 +1,266 @@
 """ai_medium.py - Reactive AI (blocks player, takes wins, else random)."""
 
-import random
+from random import getrandbits as _getrandbits
 from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
-WINNING_COMBINATIONS: List[Tuple[int, int, int]] = [
+WINNING_COMBINATIONS: Tuple[Tuple[int, int, int], ...] = (
     (0, 1, 2), (3, 4, 5), (6, 7, 8),
     (0, 3, 6), (1, 4, 7), (2, 5, 8),
     (0, 4, 8), (2, 4, 6)
-]
+)
+
+# Each winning line as a 9-bit integer mask (bit i == cell i)
+MASKS: Tuple[int, ...] = tuple(sum(1 << i for i in combo)
+                               for combo in WINNING_COMBINATIONS)
+
+FULL_BOARD = 0x1FF  # All 9 cells occupied
+
+# WIN_LUT[bb] is 1 iff the 9-bit occupancy bb contains a complete line.
+# 512 bytes, so the whole table stays L1-resident.
+WIN_LUT: bytes = bytes(
+    1 if any((bb & mask) == mask for mask in MASKS) else 0
+    for bb in range(FULL_BOARD + 1)
+)
+
+
+def _pick_random_bit(mask: int) -> int:
+    """Return a uniformly random set-bit index from a non-zero mask."""
+    n = mask.bit_count()
+    if n > 1:
+        # Rejection-sample 4 random bits (cells number at most 9); this
+        # skips randrange's Python-level argument handling
+        k = _getrandbits(4)
+        while k >= n:
+            k = _getrandbits(4)
+        for _ in range(k):
+            mask &= mask - 1  # Drop the k lowest set bits
+    return (mask & -mask).bit_length() - 1
+
+
+def _won(bb: int) -> bool:
+    """True if bb contains a complete line (single table lookup)."""
+    return WIN_LUT[bb] != 0
+
+
+def board_to_bb(board: List[Optional[str]]) -> Tuple[int, int]:
+    """Pack a list board into (x_bb, o_bb) 9-bit integer bitboards."""
+    x_bb = o_bb = 0
+    for i, cell in enumerate(board):
+        if cell == 'X':
+            x_bb |= 1 << i
+        elif cell == 'O':
+            o_bb |= 1 << i
+    return x_bb, o_bb
+
+
+@dataclass(slots=True)
+class GameState:
+    """Bitboard snapshot of a position, built once per AI decision.
+
+    Bundles the derived state (bitboards, FIFO move queues) so the
+    helpers read precomputed fields instead of rescanning the board.
+    """
+    x_bb: int
+    o_bb: int
+    x_moves: deque
+    o_moves: deque
+
+    @classmethod
+    def from_board(cls, board: List[Optional[str]],
+                   x_moves: list, o_moves: list) -> 'GameState':
+        x_bb, o_bb = board_to_bb(board)
+        return cls(x_bb, o_bb, deque(x_moves), deque(o_moves))
+
+
+def _find_winning_bit(player_bb: int, occupied: int) -> Optional[int]:
+    """Find the cell completing a line for player_bb, or None.
+
+    Each empty cell is tested with one WIN_LUT byte lookup on the
+    player's occupancy plus that cell.
+    """
+    m = ~occupied & FULL_BOARD
+    while m:
+        bit = m & -m
+        m ^= bit
+        if WIN_LUT[player_bb | bit]:
+            return bit.bit_length() - 1
+    return None
+
+
+@lru_cache(maxsize=16384)
+def _fwm(x_bb: int, o_bb: int, player_is_o: bool) -> Optional[int]:
+    """Cached win-move lookup keyed by bitboard state and player."""
+    return _find_winning_bit(o_bb if player_is_o else x_bb, x_bb | o_bb)
 
 
 def find_winning_move(board: List[Optional[str]], player: str) -> Optional[int]:
     """Find position that completes a winning line for player."""
-    for combo in WINNING_COMBINATIONS:
-        values = [board[i] for i in combo]
-        if values.count(player) == 2 and values.count(None) == 1:
-            return combo[values.index(None)]
-    return None
+    x_bb, o_bb = board_to_bb(board)
+    return _fwm(x_bb, o_bb, player == 'O')
 
 
-def get_medium_move(board: List[Optional[str]]) -> Optional[int]:
+# Sentinel policy value: no forced win/block, any empty cell is fine
+_ANY_EMPTY = -1
+
+
+def _build_symmetries() -> List[Tuple[int, ...]]:
+    """Return the 8 dihedral symmetries of the board as cell permutations.
+
+    Each permutation p maps cell i to p[i] on the transformed board.
     """
-    Priority: 1) Win if possible, 2) Block player win, 3) Random move.
+    def _rot(i: int) -> int:  # 90° clockwise: (r, c) -> (c, 2 - r)
+        r, c = divmod(i, 3)
+        return c * 3 + (2 - r)
+
+    def _flip(i: int) -> int:  # horizontal mirror: (r, c) -> (r, 2 - c)
+        r, c = divmod(i, 3)
+        return r * 3 + (2 - c)
+
+    perms = []
+    perm = tuple(range(9))
+    for _ in range(4):
+        perms.append(perm)
+        perms.append(tuple(_flip(j) for j in perm))
+        perm = tuple(_rot(j) for j in perm)
+    return perms
+
+
+SYM_PERMS: List[Tuple[int, ...]] = _build_symmetries()
+
+# Inverse permutations, to map a canonical-board cell back to the original
+_SYM_INV: List[Tuple[int, ...]] = []
+for _perm in SYM_PERMS:
+    _inv = [0] * 9
+    for _i, _j in enumerate(_perm):
+        _inv[_j] = _i
+    _SYM_INV.append(tuple(_inv))
+
+# Per-symmetry lookup: transformed value of every 9-bit mask
+_PERM_MASKS: List[List[int]] = []
+for _perm in SYM_PERMS:
+    _table = [0] * (FULL_BOARD + 1)
+    for _mask in range(FULL_BOARD + 1):
+        _t = 0
+        for _i in range(9):
+            if (_mask >> _i) & 1:
+                _t |= 1 << _perm[_i]
+        _table[_mask] = _t
+    _PERM_MASKS.append(_table)
+
+
+def _canonicalize(x_bb: int, o_bb: int) -> Tuple[int, int]:
+    """Return (smallest packed key over all symmetries, symmetry index)."""
+    best_key = (x_bb << 9) | o_bb
+    best_sym = 0
+    for s in range(1, 8):
+        table = _PERM_MASKS[s]
+        key = (table[x_bb] << 9) | table[o_bb]
+        if key < best_key:
+            best_key, best_sym = key, s
+    return best_key, best_sym
+
+
+def find_win_or_block(x_bb: int, o_bb: int) -> Tuple[Optional[int], Optional[int]]:
+    """Return (O's winning cell, X's winning cell) from one mask scan.
+
+    Both predicates are evaluated per line so the 8 combinations are
+    walked once instead of once per player.
     """
-    empty = [i for i in range(9) if board[i] is None]
-    if not empty:
-        return None
-    
-    # Try to win
-    win_move = find_winning_move(board, 'O')
+    occupied = x_bb | o_bb
+    win_pos = block_pos = None
+    for mask in MASKS:
+        if (occupied & mask) == mask:
+            continue
+        if win_pos is None and (o_bb & mask).bit_count() == 2:
+            win_pos = (mask & ~occupied).bit_length() - 1
+        if block_pos is None and (x_bb & mask).bit_count() == 2:
+            block_pos = (mask & ~occupied).bit_length() - 1
+        if win_pos is not None and block_pos is not None:
+            break
+    return win_pos, block_pos
+
+
+def _forced_move(x_bb: int, o_bb: int) -> int:
+    """Return O's forced move (win, else block) or _ANY_EMPTY."""
+    win_move, block_move = find_win_or_block(x_bb, o_bb)
     if win_move is not None:
         return win_move
-    
-    # Block player
-    block_move = find_winning_move(board, 'X')
     if block_move is not None:
         return block_move
-    
-    return random.choice(empty)
+    return _ANY_EMPTY
+
+
+def _build_policy() -> dict:
+    """Precompute the medium policy for every legal (x_bb, o_bb) state.
+
+    All disjoint bitboard pairs are enumerated (not just X-first games,
+    since the computer may open), but only canonical representatives
+    under the 8 board symmetries are stored — roughly an 8x smaller
+    table that stays cache-resident.
+    """
+    policy = {}
+    for x_bb in range(FULL_BOARD + 1):
+        for o_bb in range(FULL_BOARD + 1):
+            if x_bb & o_bb:
+                continue
+            key = (x_bb << 9) | o_bb
+            canon_key, _ = _canonicalize(x_bb, o_bb)
+            if key == canon_key:
+                policy[key] = _forced_move(x_bb, o_bb)
+    return policy
+
+
+_POLICY: dict = _build_policy()
+
+
+def get_medium_move_bb(x_bb: int, o_bb: int) -> int:
+    """Bitboard-level medium move for standard mode; returns cell or -1.
 
+    Integer-only twin of get_medium_move for callers that already track
+    bitboards: a policy lookup plus at most one RNG draw, with no list
+    board at any point.
+    """
+    if (x_bb | o_bb) == FULL_BOARD:
+        return -1
+
+    canon_key, sym = _canonicalize(x_bb, o_bb)
+    move = _POLICY[canon_key]
+    if move != _ANY_EMPTY:
+        # The stored move is on the canonical board; map it back
+        return _SYM_INV[sym][move]
+
+    return _pick_random_bit(~(x_bb | o_bb) & FULL_BOARD)
 
-def _simulate_no_draw_board(board: List[Optional[str]], player: str,
-                             position: int, player_moves: list) -> List[Optional[str]]:
+
+def get_medium_move(board: List[Optional[str]]) -> Optional[int]:
     """
-    Simulate placing a mark in No Draw mode: remove oldest if at 3,
-    then place new mark. Returns a new board copy.
+    Priority: 1) Win if possible, 2) Block player win, 3) Random move.
+    Forced moves come from the precomputed policy table.
+    """
+    x_bb, o_bb = board_to_bb(board)
+    move = get_medium_move_bb(x_bb, o_bb)
+    return move if move >= 0 else None
+
+
+def _find_win_bb_no_draw(player_bb: int, avail: int, remove_bit: int) -> int:
+    """Pure-integer core of the No Draw win search; returns cell or -1.
+
+    `avail` is the caller-computed candidate mask (empties plus the
+    oldest mark's cell when it would be removed). Operates only on int
+    locals and module-level int constants so it can be compiled as-is
+    (e.g. by a JIT) without object-mode fallbacks.
     """
-    sim_board = board.copy()
-    sim_moves = list(player_moves)
-    
-    if len(sim_moves) >= 3:
-        oldest = sim_moves[0]
-        sim_board[oldest] = None
-    
-    sim_board[position] = player
-    return sim_board
+    m = avail
+    while m:
+        bit = m & -m
+        m ^= bit
+        # Simulated placement: drop the oldest mark, place the new one
+        if _won((player_bb & ~remove_bit) | bit):
+            return bit.bit_length() - 1
+    return -1
 
 
 def find_winning_move_no_draw(board: List[Optional[str]], player: str,
@@ -64,19 +269,41 @@ def find_winning_move_no_draw(board: List[Optional[str]], player: str,
     Find a position that creates a winning line for player in No Draw mode.
     Must simulate the removal of the oldest mark before checking.
     """
-    # Determine available positions
-    available = [i for i in range(9) if board[i] is None]
-    if len(player_moves) >= 3:
-        oldest = player_moves[0]
-        if oldest not in available:
-            available.append(oldest)
-    
-    for pos in available:
-        sim_board = _simulate_no_draw_board(board, player, pos, player_moves)
-        # Check if this creates a win
-        if any(all(sim_board[i] == player for i in combo) for combo in WINNING_COMBINATIONS):
-            return pos
-    return None
+    # Under 3 marks nothing is removed, so this is the plain (cached) search
+    if len(player_moves) < 3:
+        return find_winning_move(board, player)
+
+    x_bb, o_bb = board_to_bb(board)
+    player_bb = x_bb if player == 'X' else o_bb
+    remove_bit = 1 << player_moves[0] if len(player_moves) >= 3 else 0
+    avail = (~(x_bb | o_bb) & FULL_BOARD) | remove_bit
+
+    pos = _find_win_bb_no_draw(player_bb, avail, remove_bit)
+    return pos if pos >= 0 else None
+
+
+def _medium_move_no_draw(state: GameState) -> Optional[int]:
+    """Decide O's No Draw move from a prepared GameState."""
+    empty_mask = ~(state.x_bb | state.o_bb) & FULL_BOARD
+
+    # Available cells for O, computed once and shared with the helpers
+    o_remove = 1 << state.o_moves[0] if len(state.o_moves) >= 3 else 0
+    avail_mask = empty_mask | o_remove
+    if not avail_mask:
+        return None
+
+    # Try to win
+    win_move = _find_win_bb_no_draw(state.o_bb, avail_mask, o_remove)
+    if win_move >= 0:
+        return win_move
+
+    # Block player win (simulate X's next move with removal)
+    x_remove = 1 << state.x_moves[0] if len(state.x_moves) >= 3 else 0
+    block_move = _find_win_bb_no_draw(state.x_bb, empty_mask | x_remove, x_remove)
+    if block_move >= 0 and (avail_mask >> block_move) & 1:
+        return block_move
+
+    return _pick_random_bit(avail_mask)
 
 
 def get_medium_move_no_draw(board: List[Optional[str]], x_moves: list, o_moves: list) -> Optional[int]:
@@ -85,24 +312,4 @@ def get_medium_move_no_draw(board: List[Optional[str]], x_moves: list, o_moves:
     Priority: 1) Win if possible, 2) Block player win, 3) Random move.
     Uses simulation to account for mark removal.
     """
-    # Available cells for O
-    available = [i for i in range(9) if board[i] is None]
-    if len(o_moves) >= 3:
-        oldest = o_moves[0]
-        if oldest not in available:
-            available.append(oldest)
-    
-    if not available:
-        return None
-    
-    # Try to win
-    win_move = find_winning_move_no_draw(board, 'O', o_moves)
-    if win_move is not None:
-        return win_move
-    
-    # Block player win (simulate X's next move with removal)
-    block_move = find_winning_move_no_draw(board, 'X', x_moves)
-    if block_move is not None and block_move in available:
-        return block_move
-    
-    return random.choice(available)
+    return _medium_move_no_draw(GameState.from_board(board, x_moves, o_moves))
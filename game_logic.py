@@ -27,21 +27,38 @@ class TicTacToeGame:
     
     def reset(self) -> None:
         """Reset to initial state."""
-        self.board: List[Optional[str]] = [None] * 9
+        self.board = [None] * 9
         self.current_player: str = 'X'
         self.game_over: bool = False
         self.winner: Optional[str] = None
-    
+        self._winning_combo: Optional[Tuple[int, int, int]] = None
+
+    @property
+    def board(self) -> List[Optional[str]]:
+        """The 9-cell board list."""
+        return self._board
+
+    @board.setter
+    def board(self, cells: List[Optional[str]]) -> None:
+        # Assigning a whole board (tests do this to set up positions)
+        # rebuilds the empty-cell set; make_move then maintains it
+        # incrementally so get_valid_moves/is_board_full never rescan.
+        self._board = cells
+        self._valid_moves = {i for i, cell in enumerate(cells) if cell is None}
+
     def make_move(self, position: int) -> bool:
         """Make move at position. Returns True if valid."""
         if not self.is_valid_move(position):
             return False
         
         self.board[position] = self.current_player
-        
-        if self.check_winner(self.current_player):
+        self._valid_moves.discard(position)
+
+        combo = self._find_win(self.current_player)
+        if combo is not None:
             self.game_over = True
             self.winner = self.current_player
+            self._winning_combo = combo
         elif self.is_board_full():
             self.game_over = True
             self.winner = None
@@ -57,26 +74,40 @@ class TicTacToeGame:
                 self.board[position] is None)
     
     def get_valid_moves(self) -> List[int]:
-        """Return list of empty positions."""
-        return [i for i in range(9) if self.board[i] is None]
+        """Return list of empty positions (ascending)."""
+        return sorted(self._valid_moves)
     
+    def _find_win(self, player: str) -> Optional[Tuple[int, int, int]]:
+        """Return the first winning combination for player, or None.
+
+        One scan serves both winner detection and winning-line lookup;
+        make_move caches the result so get_winning_combination does not
+        have to walk the combinations a second time.
+        """
+        board = self.board
+        for combo in WINNING_COMBINATIONS:
+            a, b, c = combo
+            if board[a] == player and board[b] == player and board[c] == player:
+                return combo
+        return None
+
     def check_winner(self, player: str) -> bool:
         """Check if player has won."""
-        return any(all(self.board[i] == player for i in combo) 
-                   for combo in WINNING_COMBINATIONS)
-    
+        return self._find_win(player) is not None
+
     def get_winning_combination(self) -> Optional[Tuple[int, int, int]]:
         """Return winning combination indices or None."""
         if self.winner is None:
             return None
-        for combo in WINNING_COMBINATIONS:
-            if all(self.board[i] == self.winner for i in combo):
-                return combo
-        return None
+        if self._winning_combo is not None:
+            return self._winning_combo
+        # Winner was set externally (e.g. by tests building a position):
+        # fall back to scanning for the line
+        return self._find_win(self.winner)
     
     def is_board_full(self) -> bool:
         """Check if board has no empty cells."""
-        return all(cell is not None for cell in self.board)
+        return not self._valid_moves
     
     def get_board_copy(self) -> List[Optional[str]]:
         """Return copy of board state."""
@@ -166,15 +197,19 @@ class NoDrawGame(TicTacToeGame):
         if len(moves) >= self.MAX_MARKS:
             removed_pos = moves.popleft()
             self.board[removed_pos] = None
-        
+            self._valid_moves.add(removed_pos)
+
         # Place new mark
         self.board[position] = player
         moves.append(position)
+        self._valid_moves.discard(position)
         
         # Check for winner after placement (and removal)
-        if self.check_winner(player):
+        combo = self._find_win(player)
+        if combo is not None:
             self.game_over = True
             self.winner = player
+            self._winning_combo = combo
         else:
             self.current_player = 'O' if player == 'X' else 'X'
         
@@ -2,11 +2,19 @@
 
 Fully responsive layout using grid geometry manager with weights.
 Scales correctly on maximize, minimize-restore, and manual resize.
+
+Screens are retained: each is built once and shown/hidden with
+grid()/grid_remove(), so navigation never destroys and rebuilds widgets.
 """
 
 import random
+import time
 import tkinter as tk
-from typing import Optional
+from tkinter import font as tkfont
+from tkinter import ttk
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Dict, List, Optional, Tuple
 
 from game_logic import TicTacToeGame, NoDrawGame
 from ai_easy import get_easy_move, get_easy_move_no_draw
@@ -16,6 +24,54 @@ from utils import (Difficulty, GameMode, DIFFICULTY_NAMES, DIFFICULTY_DESCRIPTIO
                    GAME_MODE_NAMES, GAME_MODE_DESCRIPTIONS, COLORS, FONTS,
                    get_cell_color)
 
+# Static per-mode/difficulty styling, built once at import time instead of
+# inside every screen build/show call
+_MODE_CFG = {
+    GameMode.NORMAL:  {'icon': 'Classic', 'color': '#4ade80',
+                       'subtitle': 'Standard Rules'},
+    GameMode.NO_DRAW: {'icon': 'No Draw', 'color': '#a78bfa',
+                       'subtitle': 'Marks Cycle — No Draws!'},
+}
+
+_DIFF_CFG = {
+    Difficulty.EASY:   {'color': '#4ade80', 'label': 'Easy'},
+    Difficulty.MEDIUM: {'color': '#fbbf24', 'label': 'Medium'},
+    Difficulty.HARD:   {'color': '#f87171', 'label': 'Hard'},
+}
+
+# Badge strings, preformatted so screen switches don't re-run the f-strings
+_MODE_BADGE_TEXT = {m: f"  {GAME_MODE_NAMES[m]}  " for m in GameMode}
+_DIFF_BADGE_TEXT = {d: f"  {DIFFICULTY_NAMES[d]}  " for d in Difficulty}
+
+
+@lru_cache(maxsize=8192)
+def _cached_hard(board: Tuple[Optional[str], ...]) -> Optional[int]:
+    """Memoized hard move. The hard AI is a pure function of the board,
+    so identical positions (common on turns 1-2) skip the full search.
+    The cache deliberately persists across games."""
+    return get_hard_move(list(board))
+
+
+@lru_cache(maxsize=8192)
+def _cached_hard_no_draw(board: Tuple[Optional[str], ...],
+                         xm: tuple, om: tuple) -> Optional[int]:
+    """Memoized No Draw hard move, keyed on board plus both move queues
+    (the queues affect which marks cycle out during search)."""
+    return get_hard_move_no_draw(list(board), list(xm), list(om))
+
+
+# AI dispatch by (no_draw, difficulty), resolved once per game instead of
+# walking enum comparisons on every move
+_AI_TABLE = {
+    (False, Difficulty.EASY): get_easy_move,
+    (False, Difficulty.MEDIUM): get_medium_move,
+    (False, Difficulty.HARD): lambda board: _cached_hard(tuple(board)),
+    (True, Difficulty.EASY): get_easy_move_no_draw,
+    (True, Difficulty.MEDIUM): get_medium_move_no_draw,
+    (True, Difficulty.HARD): lambda board, xm, om: _cached_hard_no_draw(
+        tuple(board), tuple(xm), tuple(om)),
+}
+
 
 class TicTacToeGUI:
     """Main GUI class — handles all screens and user interactions."""
@@ -32,11 +88,33 @@ class TicTacToeGUI:
         self.game: Optional[TicTacToeGame] = None
         self.game_mode: Optional[GameMode] = None
         self.difficulty: Optional[Difficulty] = None
-        self.cells: list = []
         self.ai_thinking: bool = False
-        self.animation_id: Optional[str] = None
+
+        # Game-screen label handles; None until _build_game_screen runs
+        self.player_score_label: Optional[tk.Label] = None
+        self.computer_score_label: Optional[tk.Label] = None
+        self.draws_label: Optional[tk.Label] = None
+
+        # AI search runs on a worker thread so minimax never blocks the
+        # Tk event loop; results are applied back on the main thread.
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._ai_future: Optional[Future] = None
+        self._ai_t0 = 0.0
+
+        # Every game-flow after() id lands here so restart/menu can
+        # cancel the whole set (poll loops, reveal delays, win flashes)
+        self._pending_callbacks: List[str] = []
+
+        # Debounce state for board-resize font scaling
+        self._resize_after_id: Optional[str] = None
+        self._pending_resize = (0, 0)
+        self._last_font_size: Optional[int] = None
+        # Named Tk fonts by size: resizing back to a seen size reuses
+        # the same font object instead of allocating a new one
+        self._font_cache: Dict[int, str] = {}
 
         self._center_window()
+        self._init_button_styles()
 
         # Root grid: one cell that expands
         self.root.rowconfigure(0, weight=1)
@@ -46,6 +124,17 @@ class TicTacToeGUI:
         self.main_container.grid(row=0, column=0, sticky='nsew',
                                  padx=18, pady=18)
         self.main_container.columnconfigure(0, weight=1)
+        self.main_container.rowconfigure(0, weight=1)
+
+        # Build every screen once; navigation just swaps visibility
+        self._score_bars: Dict[str, dict] = {}
+        self._cards: Dict[str, dict] = {}
+        self._screens: Dict[str, tk.Frame] = {
+            'mode': self._build_mode_screen(),
+            'diff': self._build_diff_screen(),
+            'game': self._build_game_screen(),
+        }
+        self._visible_screen: Optional[str] = None
 
         self._show_mode_screen()
 
@@ -58,35 +147,105 @@ class TicTacToeGUI:
         y = (self.root.winfo_screenheight() // 2) - (h // 2)
         self.root.geometry(f'{w}x{h}+{x}+{y}')
 
-    def _clear_container(self) -> None:
-        for widget in self.main_container.winfo_children():
-            widget.destroy()
-        self.cells = []
-        # Reset row weights
-        for i in range(20):
-            self.main_container.rowconfigure(i, weight=0)
-
-    def _make_btn(self, parent, text, command, bg=None, fg=None,
-                  font=None, padx=18, pady=8, **kw):
-        """Shortcut for creating a styled flat button."""
-        bg = bg or COLORS['btn_primary']
-        fg = fg or COLORS['text_primary']
-        font = font or FONTS['button']
-        btn = tk.Button(parent, text=text, command=command, font=font,
-                        bg=bg, fg=fg, activebackground=COLORS['btn_primary_hover'],
-                        activeforeground=fg, relief='flat', bd=0,
-                        padx=padx, pady=pady, cursor='hand2', **kw)
-        return btn
+    def _new_screen(self) -> tk.Frame:
+        """Create a hidden screen frame gridded into the main container."""
+        screen = tk.Frame(self.main_container, bg=COLORS['background'])
+        screen.grid(row=0, column=0, sticky='nsew')
+        screen.grid_remove()
+        screen.columnconfigure(0, weight=1)
+        return screen
+
+    def _after(self, delay_ms: int, callback) -> str:
+        """Schedule a game-flow callback and record its id for cancelling."""
+        cid = self.root.after(delay_ms, callback)
+        self._pending_callbacks.append(cid)
+        return cid
+
+    def _cancel_pending(self) -> None:
+        """Cancel every outstanding game-flow callback."""
+        for cid in self._pending_callbacks:
+            self.root.after_cancel(cid)
+        self._pending_callbacks.clear()
+
+    def _show_screen(self, name: str) -> None:
+        """Swap the visible screen without destroying anything."""
+        if self._visible_screen == name:
+            return
+        if self._visible_screen is not None:
+            self._screens[self._visible_screen].grid_remove()
+        self._screens[name].grid()
+        self._visible_screen = name
+
+    def _bind_card(self, tag: str, widgets: list, action) -> None:
+        """Wire a card's click/hover behaviour through one shared bindtag.
+
+        Each sub-widget gets the tag appended to its bindtags, so Tk
+        dispatches events through three class bindings instead of three
+        bindings per widget. All cards share the same three bound-method
+        handlers, which look the card up in self._cards by the tag
+        stamped on the event widget — no per-card closures.
+        """
+        self._cards[tag] = {'widgets': widgets, 'action': action}
+        for w in widgets:
+            w.bindtags(w.bindtags() + (tag,))
+            w.configure(cursor='hand2')
+            w._card_tag = tag
+
+        self.root.bind_class(tag, '<Button-1>', self._card_click)
+        self.root.bind_class(tag, '<Enter>', self._card_enter)
+        self.root.bind_class(tag, '<Leave>', self._card_leave)
+
+    def _card_click(self, event) -> None:
+        self._cards[event.widget._card_tag]['action']()
+
+    def _card_enter(self, event) -> None:
+        # tk.call skips the configure() kwarg-parsing wrapper
+        bg = COLORS['surface_alt']
+        for w in self._cards[event.widget._card_tag]['widgets']:
+            w.tk.call(w._w, 'configure', '-bg', bg)
+
+    def _card_leave(self, event) -> None:
+        bg = COLORS['surface']
+        for w in self._cards[event.widget._card_tag]['widgets']:
+            w.tk.call(w._w, 'configure', '-bg', bg)
+
+    def _init_button_styles(self) -> None:
+        """Register the themed button styles once at startup.
+
+        ttk buttons carry a single style= option, so Tk renders them in
+        C instead of each button re-sending ~10 styling kwargs.
+        """
+        style = ttk.Style(self.root)
+        common = dict(font=FONTS['button'], relief='flat', borderwidth=0,
+                      padding=(18, 8))
+        style.configure('Primary.TButton', background=COLORS['btn_primary'],
+                        foreground=COLORS['text_primary'], **common)
+        style.map('Primary.TButton',
+                  background=[('active', COLORS['btn_primary_hover'])])
+        style.configure('Secondary.TButton',
+                        background=COLORS['btn_secondary'],
+                        foreground=COLORS['text_secondary'], **common)
+        style.map('Secondary.TButton',
+                  background=[('active', COLORS['btn_primary_hover'])])
+        style.configure('Muted.TButton', background=COLORS['secondary'],
+                        foreground=COLORS['text_secondary'], **common)
+        style.map('Muted.TButton',
+                  background=[('active', COLORS['btn_primary_hover'])])
+
+    def _make_btn(self, parent, text, command, style='Primary.TButton'):
+        """Shortcut for creating a themed flat button."""
+        return ttk.Button(parent, text=text, command=command,
+                          style=style, cursor='hand2')
 
     # ──────────────── MODE SELECTION ────────────────
 
-    def _show_mode_screen(self) -> None:
-        """Show game mode selection (Normal / No Draw)."""
-        self._clear_container()
+    def _build_mode_screen(self) -> tk.Frame:
+        """Build the game mode selection screen (Normal / No Draw)."""
+        screen = self._new_screen()
 
         # Row 0 — title block
-        self.main_container.rowconfigure(0, weight=0)
-        title_frame = tk.Frame(self.main_container, bg=COLORS['background'])
+        screen.rowconfigure(0, weight=0)
+        title_frame = tk.Frame(screen, bg=COLORS['background'])
         title_frame.grid(row=0, column=0, sticky='ew', pady=(10, 0))
 
         tk.Label(title_frame, text="TIC TAC TOE",
@@ -96,31 +255,37 @@ class TicTacToeGUI:
                  font=FONTS['subtitle'], fg=COLORS['text_secondary'],
                  bg=COLORS['background']).pack(anchor='center', pady=(4, 0))
 
-        # Row 1 — score (only if games played)
-        if sum(self.score.values()) > 0:
-            self.main_container.rowconfigure(1, weight=0)
-            self._create_score_bar(row=1)
-        else:
-            self.main_container.rowconfigure(1, weight=0)
+        # Row 1 — score (shown once games have been played)
+        screen.rowconfigure(1, weight=0)
+        self._create_score_bar(screen, row=1, key='mode')
 
         # Row 2 — mode cards (expandable)
-        self.main_container.rowconfigure(2, weight=1)
-        cards = tk.Frame(self.main_container, bg=COLORS['background'])
+        screen.rowconfigure(2, weight=1)
+        cards = tk.Frame(screen, bg=COLORS['background'])
         cards.grid(row=2, column=0, sticky='nsew', pady=10)
         cards.columnconfigure(0, weight=1)
 
-        mode_cfg = {
-            GameMode.NORMAL:  {'icon': 'Classic', 'color': '#4ade80',
-                               'subtitle': 'Standard Rules'},
-            GameMode.NO_DRAW: {'icon': 'No Draw', 'color': '#a78bfa',
-                               'subtitle': 'Marks Cycle — No Draws!'},
-        }
-
-        for idx, mode in enumerate(GameMode):
+        for idx, (mode, cfg) in enumerate(_MODE_CFG.items()):
             cards.rowconfigure(idx, weight=1)
-            cfg = mode_cfg[mode]
             self._create_mode_card(cards, idx, mode, cfg)
 
+        return screen
+
+    def _show_mode_screen(self) -> None:
+        """Show game mode selection (Normal / No Draw)."""
+        self._cancel_pending()  # Leaving a game drops its callbacks
+        # Cancelling also kills the AI poll chain, which is what would
+        # have reset this flag and stopped the progress bar
+        self.ai_thinking = False
+        self._progress.stop()
+        self._progress.grid_remove()
+        self._refresh_score_bar('mode')
+        self._show_screen('mode')
+
+    def _select_mode(self, mode: GameMode) -> None:
+        self.game_mode = mode
+        self._show_difficulty_screen()
+
     def _create_mode_card(self, parent, row, mode, cfg):
         """Create a clickable mode card that fills available space."""
         color = cfg['color']
@@ -150,83 +315,64 @@ class TicTacToeGUI:
                             bg=COLORS['surface'])
         lbl_desc.pack(anchor='center', pady=(2, 0))
 
-        # Click + hover bindings
-        widgets = [card, inner, lbl_name, lbl_sub, lbl_desc]
-
-        def on_click(e, m=mode):
-            self.game_mode = m
-            self._show_difficulty_screen()
-
-        def on_enter(e):
-            for w in widgets:
-                w.configure(bg=COLORS['surface_alt'])
-
-        def on_leave(e):
-            for w in widgets:
-                w.configure(bg=COLORS['surface'])
-
-        for w in widgets:
-            w.bind('<Button-1>', on_click)
-            w.bind('<Enter>', on_enter)
-            w.bind('<Leave>', on_leave)
-            w.configure(cursor='hand2')
+        self._bind_card(f'modecard{row}',
+                        [card, inner, lbl_name, lbl_sub, lbl_desc],
+                        partial(self._select_mode, mode))
 
     # ──────────────── DIFFICULTY SELECTION ────────────────
 
-    def _show_difficulty_screen(self) -> None:
-        self._clear_container()
+    def _build_diff_screen(self) -> tk.Frame:
+        """Build the difficulty selection screen."""
+        screen = self._new_screen()
 
         # Row 0 — title
-        self.main_container.rowconfigure(0, weight=0)
-        title_frame = tk.Frame(self.main_container, bg=COLORS['background'])
+        screen.rowconfigure(0, weight=0)
+        title_frame = tk.Frame(screen, bg=COLORS['background'])
         title_frame.grid(row=0, column=0, sticky='ew', pady=(10, 0))
 
         tk.Label(title_frame, text="TIC TAC TOE",
                  font=FONTS['title'], fg=COLORS['primary'],
                  bg=COLORS['background']).pack(anchor='center')
 
-        # Mode badge
-        mode_colors = {GameMode.NORMAL: "#4ade80", GameMode.NO_DRAW: "#a78bfa"}
-        mc = mode_colors.get(self.game_mode, COLORS['primary'])
-        badge = tk.Label(title_frame,
-                         text=f"  {GAME_MODE_NAMES[self.game_mode]}  ",
-                         font=FONTS['badge'], fg='#0f172a', bg=mc)
-        badge.pack(anchor='center', pady=(6, 0))
+        # Mode badge — text/color set when the screen is shown
+        self._diff_mode_badge = tk.Label(title_frame, font=FONTS['badge'],
+                                         fg='#0f172a')
+        self._diff_mode_badge.pack(anchor='center', pady=(6, 0))
 
         tk.Label(title_frame, text="Choose Difficulty",
                  font=FONTS['subtitle'], fg=COLORS['text_secondary'],
                  bg=COLORS['background']).pack(anchor='center', pady=(6, 0))
 
         # Row 1 — score
-        if sum(self.score.values()) > 0:
-            self.main_container.rowconfigure(1, weight=0)
-            self._create_score_bar(row=1)
+        screen.rowconfigure(1, weight=0)
+        self._create_score_bar(screen, row=1, key='diff')
 
         # Row 2 — difficulty cards
-        self.main_container.rowconfigure(2, weight=1)
-        cards = tk.Frame(self.main_container, bg=COLORS['background'])
+        screen.rowconfigure(2, weight=1)
+        cards = tk.Frame(screen, bg=COLORS['background'])
         cards.grid(row=2, column=0, sticky='nsew', pady=10)
         cards.columnconfigure(0, weight=1)
 
-        diff_cfg = {
-            Difficulty.EASY:   {'color': '#4ade80', 'label': 'Easy'},
-            Difficulty.MEDIUM: {'color': '#fbbf24', 'label': 'Medium'},
-            Difficulty.HARD:   {'color': '#f87171', 'label': 'Hard'},
-        }
-
-        for idx, diff in enumerate(Difficulty):
+        for idx, (diff, cfg) in enumerate(_DIFF_CFG.items()):
             cards.rowconfigure(idx, weight=1)
-            cfg = diff_cfg[diff]
             self._create_diff_card(cards, idx, diff, cfg)
 
         # Row 3 — back button
-        self.main_container.rowconfigure(3, weight=0)
-        back = self._make_btn(self.main_container, "Back to Modes",
+        screen.rowconfigure(3, weight=0)
+        back = self._make_btn(screen, "Back to Modes",
                               self._show_mode_screen,
-                              bg=COLORS['btn_secondary'],
-                              fg=COLORS['text_secondary'])
+                              style='Secondary.TButton')
         back.grid(row=3, column=0, pady=(0, 6))
 
+        return screen
+
+    def _show_difficulty_screen(self) -> None:
+        self._diff_mode_badge.configure(
+            text=_MODE_BADGE_TEXT[self.game_mode],
+            bg=_MODE_CFG[self.game_mode]['color'])
+        self._refresh_score_bar('diff')
+        self._show_screen('diff')
+
     def _create_diff_card(self, parent, row, diff, cfg):
         color = cfg['color']
         card = tk.Frame(parent, bg=COLORS['surface'],
@@ -249,30 +395,17 @@ class TicTacToeGUI:
                             bg=COLORS['surface'])
         lbl_desc.pack(anchor='center', pady=(2, 0))
 
-        widgets = [card, inner, lbl_name, lbl_desc]
-
-        def on_click(e, d=diff):
-            self._start_game(d)
-
-        def on_enter(e):
-            for w in widgets:
-                w.configure(bg=COLORS['surface_alt'])
-
-        def on_leave(e):
-            for w in widgets:
-                w.configure(bg=COLORS['surface'])
-
-        for w in widgets:
-            w.bind('<Button-1>', on_click)
-            w.bind('<Enter>', on_enter)
-            w.bind('<Leave>', on_leave)
-            w.configure(cursor='hand2')
+        self._bind_card(f'diffcard{row}',
+                        [card, inner, lbl_name, lbl_desc],
+                        partial(self._start_game, diff))
 
     # ──────────────── SCORE BAR ────────────────
 
-    def _create_score_bar(self, row: int) -> None:
-        bar = tk.Frame(self.main_container, bg=COLORS['surface'])
+    def _create_score_bar(self, parent, row: int, key: str) -> None:
+        """Build a wins/draws/losses bar; refreshed via _refresh_score_bar."""
+        bar = tk.Frame(parent, bg=COLORS['surface'])
         bar.grid(row=row, column=0, sticky='ew', pady=(8, 0), padx=4)
+        bar.grid_remove()
         bar.columnconfigure(0, weight=1)
         bar.columnconfigure(1, weight=0)
         bar.columnconfigure(2, weight=1)
@@ -282,33 +415,51 @@ class TicTacToeGUI:
         pf.grid(row=0, column=0, padx=12, pady=8)
         tk.Label(pf, text="WINS", font=FONTS['score_label'],
                  fg=COLORS['win'], bg=COLORS['surface']).pack()
-        tk.Label(pf, text=str(self.score['wins']),
-                 font=FONTS['score_num'], fg=COLORS['win'],
-                 bg=COLORS['surface']).pack()
+        wins_lbl = tk.Label(pf, text="0", font=FONTS['score_num'],
+                            fg=COLORS['win'], bg=COLORS['surface'])
+        wins_lbl.pack()
 
         # Separator + draws
         sf = tk.Frame(bar, bg=COLORS['surface'])
         sf.grid(row=0, column=1, padx=8, pady=8)
         tk.Label(sf, text="vs", font=FONTS['small'],
                  fg=COLORS['text_secondary'], bg=COLORS['surface']).pack()
-        tk.Label(sf, text=f"Draws: {self.score['draws']}",
-                 font=('Segoe UI', 9), fg=COLORS['draw'],
-                 bg=COLORS['surface']).pack()
+        draws_lbl = tk.Label(sf, text="Draws: 0", font=('Segoe UI', 9),
+                             fg=COLORS['draw'], bg=COLORS['surface'])
+        draws_lbl.pack()
 
         # Losses
         cf = tk.Frame(bar, bg=COLORS['surface'])
         cf.grid(row=0, column=2, padx=12, pady=8)
         tk.Label(cf, text="LOSSES", font=FONTS['score_label'],
                  fg=COLORS['danger'], bg=COLORS['surface']).pack()
-        tk.Label(cf, text=str(self.score['losses']),
-                 font=FONTS['score_num'], fg=COLORS['danger'],
-                 bg=COLORS['surface']).pack()
+        losses_lbl = tk.Label(cf, text="0", font=FONTS['score_num'],
+                              fg=COLORS['danger'], bg=COLORS['surface'])
+        losses_lbl.pack()
+
+        self._score_bars[key] = {'bar': bar, 'wins': wins_lbl,
+                                 'draws': draws_lbl, 'losses': losses_lbl}
+
+    def _refresh_score_bar(self, key: str) -> None:
+        """Update a score bar's numbers; hidden until a game was played."""
+        handles = self._score_bars[key]
+        if sum(self.score.values()) > 0:
+            handles['wins'].configure(text=str(self.score['wins']))
+            handles['draws'].configure(text=f"Draws: {self.score['draws']}")
+            handles['losses'].configure(text=str(self.score['losses']))
+            handles['bar'].grid()
+        else:
+            handles['bar'].grid_remove()
 
     # ──────────────── GAME SCREEN ────────────────
 
     def _start_game(self, difficulty: Difficulty) -> None:
         self.difficulty = difficulty
         self.game = NoDrawGame() if self.game_mode == GameMode.NO_DRAW else TicTacToeGame()
+        self._ai_fn = _AI_TABLE[(self._is_no_draw, difficulty)]
+        self._ai_future = None  # Drop any in-flight result for an old game
+        self.ai_thinking = False  # The old game's poll chain is gone
+        self._cancel_pending()
         # Randomly decide who goes first
         self.computer_starts = random.choice([True, False])
         if self.computer_starts:
@@ -321,37 +472,25 @@ class TicTacToeGUI:
     def _is_no_draw(self) -> bool:
         return self.game_mode == GameMode.NO_DRAW
 
-    def _show_game_screen(self) -> None:
-        self._clear_container()
-
-        diff_colors = {
-            Difficulty.EASY: '#4ade80',
-            Difficulty.MEDIUM: '#fbbf24',
-            Difficulty.HARD: '#f87171',
-        }
-        mode_colors = {
-            GameMode.NORMAL: '#4ade80',
-            GameMode.NO_DRAW: '#a78bfa',
-        }
+    def _build_game_screen(self) -> tk.Frame:
+        """Build the game screen; badges and labels update per game."""
+        screen = self._new_screen()
 
-        # Row 0 — Badges
-        self.main_container.rowconfigure(0, weight=0)
-        badge_frame = tk.Frame(self.main_container, bg=COLORS['background'])
+        # Row 0 — Badges (configured when a game starts)
+        screen.rowconfigure(0, weight=0)
+        badge_frame = tk.Frame(screen, bg=COLORS['background'])
         badge_frame.grid(row=0, column=0, sticky='ew', pady=(6, 0))
 
-        mc = mode_colors.get(self.game_mode, COLORS['primary'])
-        dc = diff_colors.get(self.difficulty, COLORS['primary'])
-
-        tk.Label(badge_frame,
-                 text=f"  {GAME_MODE_NAMES[self.game_mode]}  ",
-                 font=FONTS['badge'], fg='#0f172a', bg=mc).pack(side='left', padx=4)
-        tk.Label(badge_frame,
-                 text=f"  {DIFFICULTY_NAMES[self.difficulty]}  ",
-                 font=FONTS['badge'], fg='#0f172a', bg=dc).pack(side='left', padx=4)
+        self._game_mode_badge = tk.Label(badge_frame, font=FONTS['badge'],
+                                         fg='#0f172a')
+        self._game_mode_badge.pack(side='left', padx=4)
+        self._game_diff_badge = tk.Label(badge_frame, font=FONTS['badge'],
+                                         fg='#0f172a')
+        self._game_diff_badge.pack(side='left', padx=4)
 
         # Row 1 — Score panel
-        self.main_container.rowconfigure(1, weight=0)
-        score_bar = tk.Frame(self.main_container, bg=COLORS['surface'])
+        screen.rowconfigure(1, weight=0)
+        score_bar = tk.Frame(screen, bg=COLORS['surface'])
         score_bar.grid(row=1, column=0, sticky='ew', pady=6, padx=4)
         score_bar.columnconfigure(0, weight=1)
         score_bar.columnconfigure(1, weight=0)
@@ -390,75 +529,166 @@ class TicTacToeGUI:
             bg=COLORS['surface'])
         self.computer_score_label.pack()
 
-        # Row 2 — Status
-        self.main_container.rowconfigure(2, weight=0)
+        # Row 2 — Status (label plus a hidden thinking indicator)
+        screen.rowconfigure(2, weight=0)
+        status_frame = tk.Frame(screen, bg=COLORS['background'])
+        status_frame.grid(row=2, column=0, sticky='ew', pady=(8, 6))
+        status_frame.columnconfigure(0, weight=1)
+
         self.status_label = tk.Label(
-            self.main_container, text="Your turn!",
+            status_frame, text="Your turn!",
             font=FONTS['status'], fg=COLORS['player_x'],
             bg=COLORS['background'])
-        self.status_label.grid(row=2, column=0, sticky='ew', pady=(8, 6))
+        self.status_label.grid(row=0, column=0)
+
+        # Indeterminate bar animates inside Tk's C core, so "thinking"
+        # feedback costs no Python callbacks while the worker searches
+        self._progress = ttk.Progressbar(status_frame, mode='indeterminate',
+                                         length=160)
+        self._progress.grid(row=1, column=0, pady=(4, 0))
+        self._progress.grid_remove()
 
         # Row 3 — Board (expandable!)
-        self.main_container.rowconfigure(3, weight=1)
-        self._create_board(row=3)
+        screen.rowconfigure(3, weight=1)
+        self._create_board(screen, row=3)
 
         # Row 4 — Controls
-        self.main_container.rowconfigure(4, weight=0)
-        self._create_controls(row=4)
+        screen.rowconfigure(4, weight=0)
+        self._create_controls(screen, row=4)
+
+        return screen
+
+    def _show_game_screen(self) -> None:
+        self._game_mode_badge.configure(
+            text=_MODE_BADGE_TEXT[self.game_mode],
+            bg=_MODE_CFG[self.game_mode]['color'])
+        self._game_diff_badge.configure(
+            text=_DIFF_BADGE_TEXT[self.difficulty],
+            bg=_DIFF_CFG[self.difficulty]['color'])
+
+        # Fresh board for the new game
+        self._clear_board_canvas()
+
+        self._update_score_display()
+        self._update_status()
+        self._show_screen('game')
 
     # ──────────────── BOARD ────────────────
 
-    def _create_board(self, row: int) -> None:
-        """Create a 3×3 board using grid — cells expand equally."""
-        outer = tk.Frame(self.main_container, bg=COLORS['background'])
+    def _create_board(self, parent, row: int) -> None:
+        """Create the 3×3 board as a single Canvas.
+
+        One Canvas with 9 rectangles and 9 text items replaces 9 Button
+        widgets: cell updates become itemconfigure calls on Tk's C fast
+        path, and resize reflows items instead of reconfiguring widgets.
+        """
+        outer = tk.Frame(parent, bg=COLORS['background'])
         outer.grid(row=row, column=0, sticky='nsew', padx=10, pady=4)
         outer.columnconfigure(0, weight=1)
         outer.rowconfigure(0, weight=1)
 
-        # Board frame centered inside outer
-        board = tk.Frame(outer, bg=COLORS['primary'])
-        board.place(relx=0.5, rely=0.5, anchor='center',
-                    relwidth=0.95, relheight=0.95)
-
-        for r in range(3):
-            board.rowconfigure(r, weight=1)
-        for c in range(3):
-            board.columnconfigure(c, weight=1)
-
-        self.cells = []
+        # Canvas centered inside outer; its bg shows through as grid lines
+        canvas = tk.Canvas(outer, highlightthickness=0, bg=COLORS['primary'],
+                           cursor='hand2')
+        canvas.place(relx=0.5, rely=0.5, anchor='center',
+                     relwidth=0.95, relheight=0.95)
+        self._canvas = canvas
+
+        self._cell_rects: List[int] = []
+        self._cell_texts: List[int] = []
+        # Last rendered (text, fg, bg) per cell, for dirty-diffing
+        self._cell_state = [None] * 9
         for i in range(9):
-            r, c = divmod(i, 3)
-            btn = tk.Button(board, text='', font=FONTS['cell'],
-                            bg=COLORS['cell_bg'], fg=COLORS['text_primary'],
-                            activebackground=COLORS['cell_hover'],
-                            relief='flat', bd=0,
-                            command=lambda p=i: self._on_cell_click(p))
-            btn.grid(row=r, column=c, sticky='nsew', padx=2, pady=2)
-            self.cells.append(btn)
+            rect = canvas.create_rectangle(0, 0, 1, 1,
+                                           fill=COLORS['cell_bg'], width=0)
+            self._cell_rects.append(rect)
+            text = canvas.create_text(0, 0, text='', font=FONTS['cell'],
+                                      fill=COLORS['text_primary'])
+            self._cell_texts.append(text)
 
-            btn.bind('<Enter>', lambda e, b=btn: self._on_cell_hover(b, True))
-            btn.bind('<Leave>', lambda e, b=btn: self._on_cell_hover(b, False))
+        self._cell_w = self._cell_h = 1
+        self._hover_cell: Optional[int] = None
 
-        # Bind resize to update font sizes
-        board.bind('<Configure>', self._on_board_resize)
-        self._board_frame = board
+        canvas.bind('<Button-1>', self._on_canvas_click)
+        canvas.bind('<Motion>', self._on_canvas_motion)
+        canvas.bind('<Leave>', self._on_canvas_leave)
+        canvas.bind('<Configure>', self._on_board_resize)
 
     def _on_board_resize(self, event) -> None:
-        """Dynamically scale cell font size to match board dimensions."""
-        if not self.cells:
+        """Coalesce the <Configure> storm during a live resize.
+
+        A window drag fires dozens of events per second; relaying out
+        18 canvas items for each is wasted work. Only the last event
+        within 40ms triggers an actual reflow.
+        """
+        self._pending_resize = (event.width, event.height)
+        if self._resize_after_id is not None:
+            self.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.root.after(40, self._apply_board_resize)
+
+    def _apply_board_resize(self) -> None:
+        """Reflow cell rectangles/text to the debounced canvas size."""
+        self._resize_after_id = None
+        width, height = self._pending_resize
+        cw = max(1, width // 3)
+        ch = max(1, height // 3)
+        self._cell_w, self._cell_h = cw, ch
+
+        canvas = self._canvas
+        size = max(12, min(height // 3, width // 3) // 3)
+        font = None
+        if size != self._last_font_size:
+            font = self._font_cache.get(size)
+            if font is None:
+                font = tkfont.Font(family='Segoe UI', size=size,
+                                   weight='bold').name
+                self._font_cache[size] = font
+        self._last_font_size = size
+
+        for i in range(9):
+            r, c = divmod(i, 3)
+            x0, y0 = c * cw + 2, r * ch + 2
+            canvas.coords(self._cell_rects[i], x0, y0,
+                          x0 + cw - 4, y0 + ch - 4)
+            canvas.coords(self._cell_texts[i], x0 + cw // 2, y0 + ch // 2)
+            if font is not None:
+                canvas.itemconfigure(self._cell_texts[i], font=font)
+
+    def _cell_at(self, x: int, y: int) -> Optional[int]:
+        """Map canvas coordinates to a cell index, or None outside."""
+        c = x // self._cell_w
+        r = y // self._cell_h
+        if 0 <= c < 3 and 0 <= r < 3:
+            return r * 3 + c
+        return None
+
+    def _on_canvas_click(self, event) -> None:
+        pos = self._cell_at(event.x, event.y)
+        if pos is not None:
+            self._on_cell_click(pos)
+
+    def _on_canvas_motion(self, event) -> None:
+        pos = self._cell_at(event.x, event.y)
+        if pos == self._hover_cell:
             return
-        cell_h = event.height // 3
-        cell_w = event.width // 3
-        size = max(12, min(cell_h, cell_w) // 3)
-        font = ('Segoe UI', size, 'bold')
-        for btn in self.cells:
-            btn.configure(font=font)
-
-    def _on_cell_hover(self, btn: tk.Button, entering: bool) -> None:
-        if btn['text'] == '' and not self.ai_thinking:
-            if self.game and not self.game.game_over:
-                btn.configure(bg=COLORS['cell_hover'] if entering
-                              else COLORS['cell_bg'])
+        self._set_hover(None)
+        if (pos is not None and not self.ai_thinking and self.game
+                and not self.game.game_over and self.game.board[pos] is None):
+            self._set_hover(pos)
+
+    def _on_canvas_leave(self, event) -> None:
+        self._set_hover(None)
+
+    def _set_hover(self, pos: Optional[int]) -> None:
+        if self._hover_cell is not None:
+            state = self._cell_state[self._hover_cell]
+            bg = state[2] if state else COLORS['cell_bg']
+            self._canvas.itemconfigure(self._cell_rects[self._hover_cell],
+                                       fill=bg)
+        self._hover_cell = pos
+        if pos is not None:
+            self._canvas.itemconfigure(self._cell_rects[pos],
+                                       fill=COLORS['cell_hover'])
 
     def _on_cell_click(self, position: int) -> None:
         if self.ai_thinking or self.game.game_over or self.game.current_player != 'X':
@@ -484,28 +714,45 @@ class TicTacToeGUI:
     def _make_ai_move(self) -> None:
         self.ai_thinking = True
         self._update_status()
-        self.root.after(400, self._execute_ai_move)
-
-    def _execute_ai_move(self) -> None:
+        # Snapshot game state on the main thread; the worker only ever
+        # touches these copies (Tk itself is not thread-safe)
         board = self.game.get_board_copy()
-
         if self._is_no_draw:
-            xm = list(self.game.x_moves)
-            om = list(self.game.o_moves)
-            if self.difficulty == Difficulty.EASY:
-                move = get_easy_move_no_draw(board, xm, om)
-            elif self.difficulty == Difficulty.MEDIUM:
-                move = get_medium_move_no_draw(board, xm, om)
-            else:
-                move = get_hard_move_no_draw(board, xm, om)
+            xm: Optional[list] = list(self.game.x_moves)
+            om: Optional[list] = list(self.game.o_moves)
         else:
-            if self.difficulty == Difficulty.EASY:
-                move = get_easy_move(board)
-            elif self.difficulty == Difficulty.MEDIUM:
-                move = get_medium_move(board)
-            else:
-                move = get_hard_move(board)
+            xm = om = None
+        self._ai_t0 = time.monotonic()
+        self._ai_future = self._executor.submit(
+            self._compute_ai_move, board, xm, om)
+        self._after(30, self._poll_ai)
+
+    def _compute_ai_move(self, board: List[Optional[str]],
+                         xm: Optional[list], om: Optional[list]) -> Optional[int]:
+        """Pick the AI move. Runs on the worker thread; no Tk access."""
+        if xm is not None:
+            return self._ai_fn(board, xm, om)
+        return self._ai_fn(board)
+
+    def _poll_ai(self) -> None:
+        future = self._ai_future
+        if future is None:
+            return
+        if not future.done():
+            self._after(30, self._poll_ai)
+            return
+        self._ai_future = None
+        # Keep a ~400ms "thinking" feel on fast difficulties without
+        # stacking extra delay on top of a slow search
+        remaining = max(0.0, 0.4 - (time.monotonic() - self._ai_t0))
+        move = future.result()
+        if remaining > 0:
+            self._after(int(remaining * 1000),
+                        partial(self._apply_ai_move, move))
+        else:
+            self._apply_ai_move(move)
 
+    def _apply_ai_move(self, move: Optional[int]) -> None:
         if move is not None:
             self.game.make_move(move)
 
@@ -518,37 +765,59 @@ class TicTacToeGUI:
 
     # ──────────────── BOARD UPDATE ────────────────
 
+    def _style_cell(self, i: int, value: Optional[str],
+                    oldest_x: Optional[int], oldest_o: Optional[int],
+                    tint_oldest: bool) -> tuple:
+        """Return the (text, fg, bg) render triple for one cell."""
+        if not value:
+            return ('', COLORS['text_primary'], COLORS['cell_bg'])
+        fg = get_cell_color(value)
+        # Subtle tint for oldest marks in No Draw
+        if tint_oldest and ((value == 'X' and i == oldest_x)
+                            or (value == 'O' and i == oldest_o)):
+            return (value, fg, COLORS['oldest_mark'])
+        return (value, fg, COLORS['cell_bg'])
+
     def _update_board(self) -> None:
+        # Evaluate the mode flag and oldest marks once, not per cell:
+        # get_oldest_mark scans a deque each call
+        is_no_draw = self._is_no_draw
         oldest_x = oldest_o = None
-        if self._is_no_draw:
+        if is_no_draw:
             oldest_x = self.game.get_oldest_mark('X')
             oldest_o = self.game.get_oldest_mark('O')
+        tint_oldest = is_no_draw and not self.game.game_over
+
+        # Local-binding prologue: everything the loop touches becomes a
+        # LOAD_FAST instead of repeated attribute/global lookups
+        board = self.game.board
+        canvas = self._canvas
+        itemconfigure = canvas.itemconfigure
+        cell_texts = self._cell_texts
+        cell_rects = self._cell_rects
+        cell_state = self._cell_state
+        style_cell = self._style_cell
 
-        for i, btn in enumerate(self.cells):
-            value = self.game.board[i]
-            if value:
-                fg = get_cell_color(value)
-                btn.configure(text=value, fg=fg,
-                              state='disabled', disabledforeground=fg)
-                # Subtle tint for oldest marks in No Draw
-                if (self._is_no_draw and not self.game.game_over
-                        and ((value == 'X' and i == oldest_x)
-                             or (value == 'O' and i == oldest_o))):
-                    btn.configure(bg=COLORS['oldest_mark'])
-                else:
-                    btn.configure(bg=COLORS['cell_bg'])
-            else:
-                btn.configure(text='', state='normal', bg=COLORS['cell_bg'])
+        for i in range(9):
+            target = style_cell(i, board[i], oldest_x, oldest_o, tint_oldest)
+            # Only touch cells whose rendered state actually changed;
+            # each itemconfigure is a Tcl round-trip
+            if target == cell_state[i]:
+                continue
+            cell_state[i] = target
+            text, fg, bg = target
+            itemconfigure(cell_texts[i], text=text, fill=fg)
+            itemconfigure(cell_rects[i], fill=bg)
 
     def _update_status(self) -> None:
         if self.ai_thinking:
             self.status_label.configure(text="Computer thinking...",
                                         fg=COLORS['player_o'])
-            self._animate_thinking()
+            self._progress.grid()
+            self._progress.start(100)
         elif self.game.game_over:
-            if self.animation_id:
-                self.root.after_cancel(self.animation_id)
-                self.animation_id = None
+            self._progress.stop()
+            self._progress.grid_remove()
 
             if self.game.winner == 'X':
                 self.score['wins'] += 1
@@ -565,9 +834,8 @@ class TicTacToeGUI:
                                             fg=COLORS['draw'])
             self._update_score_display()
         else:
-            if self.animation_id:
-                self.root.after_cancel(self.animation_id)
-                self.animation_id = None
+            self._progress.stop()
+            self._progress.grid_remove()
             if self.game.current_player == 'X':
                 self.status_label.configure(text="Your turn!",
                                             fg=COLORS['player_x'])
@@ -576,23 +844,15 @@ class TicTacToeGUI:
                                             fg=COLORS['player_o'])
 
     def _update_score_display(self) -> None:
-        if hasattr(self, 'player_score_label'):
-            self.player_score_label.configure(text=str(self.score['wins']))
-        if hasattr(self, 'computer_score_label'):
-            self.computer_score_label.configure(text=str(self.score['losses']))
-        if hasattr(self, 'draws_label'):
-            self.draws_label.configure(text=f"Draws: {self.score['draws']}")
-
-    def _animate_thinking(self) -> None:
-        if not self.ai_thinking:
-            return
-        current = self.status_label.cget('text')
-        if current.endswith('...'):
-            new = "Computer thinking"
-        else:
-            new = current + "."
-        self.status_label.configure(text=new)
-        self.animation_id = self.root.after(300, self._animate_thinking)
+        lbl = self.player_score_label
+        if lbl is not None:
+            lbl.configure(text=str(self.score['wins']))
+        lbl = self.computer_score_label
+        if lbl is not None:
+            lbl.configure(text=str(self.score['losses']))
+        lbl = self.draws_label
+        if lbl is not None:
+            lbl.configure(text=f"Draws: {self.score['draws']}")
 
     def _celebrate_win(self) -> None:
         colors = [COLORS['win'], COLORS['player_x'],
@@ -601,37 +861,45 @@ class TicTacToeGUI:
         def flash(count=0):
             if count < 6 and not self.ai_thinking:
                 self.status_label.configure(fg=colors[count % len(colors)])
-                self.root.after(200, lambda: flash(count + 1))
+                self._after(200, lambda: flash(count + 1))
         flash()
 
     def _highlight_winner(self) -> None:
         combo = self.game.get_winning_combination()
         if combo:
+            canvas = self._canvas
+            # One Tcl script, one round-trip, instead of 6 itemconfigures
+            w = canvas._w
+            win_bg = COLORS['win']
+            script = ';'.join(
+                f'{w} itemconfigure {self._cell_rects[i]} -fill {win_bg};'
+                f'{w} itemconfigure {self._cell_texts[i]} -fill #0f172a'
+                for i in combo)
+            canvas.tk.eval(script)
             for i in combo:
-                self.cells[i].configure(bg=COLORS['win'],
-                                        disabledforeground='#0f172a')
+                self._cell_state[i] = None  # Painted outside the diff cache
+            # A lingering hover on a winning cell would be "restored"
+            # to the plain background by the next motion event
+            self._hover_cell = None
 
     # ──────────────── CONTROLS ────────────────
 
-    def _create_controls(self, row: int) -> None:
-        controls = tk.Frame(self.main_container, bg=COLORS['background'])
+    def _create_controls(self, parent, row: int) -> None:
+        controls = tk.Frame(parent, bg=COLORS['background'])
         controls.grid(row=row, column=0, sticky='ew', pady=(10, 6))
         controls.columnconfigure(0, weight=1)
         controls.columnconfigure(1, weight=1)
         controls.columnconfigure(2, weight=1)
 
-        self._make_btn(controls, "Restart", self._restart_game,
-                       bg=COLORS['btn_primary']).grid(
-                           row=0, column=0, sticky='ew', padx=4)
+        self._make_btn(controls, "Restart", self._restart_game).grid(
+            row=0, column=0, sticky='ew', padx=4)
 
         self._make_btn(controls, "Menu", self._show_mode_screen,
-                       bg=COLORS['btn_secondary'],
-                       fg=COLORS['text_secondary']).grid(
+                       style='Secondary.TButton').grid(
                            row=0, column=1, sticky='ew', padx=4)
 
         self._make_btn(controls, "Reset Score", self._reset_score,
-                       bg=COLORS['secondary'],
-                       fg=COLORS['text_secondary']).grid(
+                       style='Muted.TButton').grid(
                            row=0, column=2, sticky='ew', padx=4)
 
     def _reset_score(self) -> None:
@@ -641,18 +909,25 @@ class TicTacToeGUI:
     def _restart_game(self) -> None:
         if not self.game:
             return
-        if self.animation_id:
-            self.root.after_cancel(self.animation_id)
-            self.animation_id = None
         self.game.reset()
         self.ai_thinking = False
+        self._ai_future = None  # Drop any in-flight result for an old game
+        self._cancel_pending()
+        self._clear_board_canvas()
         # Randomly decide who goes first
         self.computer_starts = random.choice([True, False])
         if self.computer_starts:
             self.game.current_player = 'O'
         self._update_board()
         self._update_status()
-        for cell in self.cells:
-            cell.configure(bg=COLORS['cell_bg'], state='normal')
         if self.computer_starts:
             self._make_ai_move()
+
+    def _clear_board_canvas(self) -> None:
+        """Repaint every cell empty and reset the dirty-diff cache."""
+        self._cell_state = [None] * 9
+        self._hover_cell = None
+        canvas = self._canvas
+        for i in range(9):
+            canvas.itemconfigure(self._cell_texts[i], text='')
+            canvas.itemconfigure(self._cell_rects[i], fill=COLORS['cell_bg'])
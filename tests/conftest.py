@@ -0,0 +1,12 @@
+"""Shared test configuration: put the project root on sys.path once.
+
+Runs once per session under pytest, replacing the per-module
+sys.path.insert boilerplate the test files used to carry.
+"""
+
+import os
+import sys
+
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
@@ -1,10 +1,6 @@
 """Unit tests for AI modules."""
 
 import unittest
-import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from ai_easy import get_easy_move
 from ai_medium import get_medium_move, find_winning_move
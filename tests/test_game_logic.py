@@ -1,10 +1,6 @@
 """Unit tests for game_logic.py"""
 
 import unittest
-import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from game_logic import TicTacToeGame, WINNING_COMBINATIONS
 
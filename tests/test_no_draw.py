@@ -1,10 +1,8 @@
 """Unit tests for No Draw mode - game logic and AI."""
 
 import unittest
-import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from collections import deque
+from unittest.mock import patch
 
 from game_logic import NoDrawGame, TicTacToeGame, WINNING_COMBINATIONS
 from ai_easy import get_easy_move_no_draw
@@ -15,8 +13,11 @@ from ai_hard import get_hard_move_no_draw
 class TestNoDrawGameInit(unittest.TestCase):
     """Tests for NoDrawGame initialization."""
 
-    def setUp(self):
-        self.game = NoDrawGame()
+    @classmethod
+    def setUpClass(cls):
+        # Every test here only reads initial state, so one shared
+        # instance replaces five constructions
+        cls.game = NoDrawGame()
 
     def test_initial_board_empty(self):
         """Board should have 9 empty cells on init."""
@@ -43,17 +44,31 @@ class TestNoDrawGameInit(unittest.TestCase):
 class TestNoDrawGameMoves(unittest.TestCase):
     """Tests for No Draw move mechanics (placement + removal)."""
 
+    @classmethod
+    def setUpClass(cls):
+        # Several tests start from the same 6-move opener
+        # (X: 0, 2, 4 / O: 1, 3, 5); play it once and snapshot the
+        # state so each test restores it instead of replaying
+        game = NoDrawGame()
+        for pos in (0, 1, 2, 3, 4, 5):
+            game.make_move(pos)
+        cls._opener = (list(game.board), list(game.x_moves),
+                       list(game.o_moves), game.current_player)
+
     def setUp(self):
         self.game = NoDrawGame()
 
+    def _play_opener(self):
+        """Restore the shared opener snapshot onto self.game."""
+        board, x_moves, o_moves, current = self._opener
+        self.game.board = list(board)
+        self.game.x_moves = deque(x_moves)
+        self.game.o_moves = deque(o_moves)
+        self.game.current_player = current
+
     def test_first_three_moves_no_removal(self):
         """First 3 moves per player should not remove anything."""
-        self.game.make_move(0)  # X at 0
-        self.game.make_move(1)  # O at 1
-        self.game.make_move(2)  # X at 2
-        self.game.make_move(3)  # O at 3
-        self.game.make_move(4)  # X at 4
-        self.game.make_move(5)  # O at 5
+        self._play_opener()
 
         # All 6 cells should be occupied
         self.assertEqual(self.game.board[0], 'X')
@@ -70,12 +85,7 @@ class TestNoDrawGameMoves(unittest.TestCase):
     def test_fourth_move_removes_oldest(self):
         """4th move by a player should remove their oldest mark."""
         # X moves: 0, 2, 4; O moves: 1, 3, 5
-        self.game.make_move(0)  # X at 0
-        self.game.make_move(1)  # O at 1
-        self.game.make_move(2)  # X at 2
-        self.game.make_move(3)  # O at 3
-        self.game.make_move(4)  # X at 4
-        self.game.make_move(5)  # O at 5
+        self._play_opener()
 
         # Now X's 4th move: place at 6, oldest (0) should be removed
         self.game.make_move(6)  # X at 6, remove X from 0
@@ -86,12 +96,7 @@ class TestNoDrawGameMoves(unittest.TestCase):
 
     def test_removal_only_affects_own_marks(self):
         """Players should only remove their own marks, not opponent's."""
-        self.game.make_move(0)  # X at 0
-        self.game.make_move(1)  # O at 1
-        self.game.make_move(2)  # X at 2
-        self.game.make_move(3)  # O at 3
-        self.game.make_move(4)  # X at 4
-        self.game.make_move(5)  # O at 5
+        self._play_opener()
 
         # X's 4th move removes X's oldest (0), NOT O's
         self.game.make_move(6)  # X at 6
@@ -155,12 +160,7 @@ class TestNoDrawGameMoves(unittest.TestCase):
 
     def test_board_is_never_full(self):
         """is_board_full should always return False in No Draw mode."""
-        self.game.make_move(0)
-        self.game.make_move(1)
-        self.game.make_move(2)
-        self.game.make_move(3)
-        self.game.make_move(4)
-        self.game.make_move(5)
+        self._play_opener()
         # 6 cells filled, 3 empty - but even if all were filled:
         self.assertFalse(self.game.is_board_full())
 
@@ -289,13 +289,15 @@ class TestNoDrawAIEasy(unittest.TestCase):
         board = ['X', 'O', 'X', 'O', 'X', 'O', None, None, None]
         x_moves = [0, 2, 4]
         o_moves = [1, 3, 5]
-        # Run multiple times (random) to verify oldest is sometimes chosen
+        # The AI picks the k-th candidate (ascending cell order) from a
+        # random draw; forcing each k in turn deterministically covers
+        # the whole candidate set instead of sampling 100 times
         moves_seen = set()
-        for _ in range(100):
-            move = get_easy_move_no_draw(board, x_moves, o_moves)
-            moves_seen.add(move)
+        for k in range(4):
+            with patch('ai_easy._getrandbits', return_value=k):
+                moves_seen.add(get_easy_move_no_draw(board, x_moves, o_moves))
         # Position 1 (O's oldest) should be available alongside 6, 7, 8
-        self.assertTrue(moves_seen.issubset({1, 6, 7, 8}))
+        self.assertEqual(moves_seen, {1, 6, 7, 8})
 
 
 class TestNoDrawAIMedium(unittest.TestCase):
@@ -419,11 +421,11 @@ class TestNoDrawGameIntegration(unittest.TestCase):
                 if valid:
                     game.make_move(valid[0])
             else:
-                # AI plays
-                board = game.get_board_copy()
-                x_moves = list(game.x_moves)
-                o_moves = list(game.o_moves)
-                move = get_easy_move_no_draw(board, x_moves, o_moves)
+                # AI plays; get_easy_move_no_draw only reads its
+                # arguments, so the live board and deques can be passed
+                # without defensive copies
+                move = get_easy_move_no_draw(game.board, game.x_moves,
+                                             game.o_moves)
                 if move is not None:
                     result = game.make_move(move)
                     self.assertTrue(result, f"AI made invalid move at {move}")
@@ -438,8 +440,8 @@ class TestNoDrawGameIntegration(unittest.TestCase):
             if valid:
                 game.make_move(valid[0])
             
-            x_count = sum(1 for c in game.board if c == 'X')
-            o_count = sum(1 for c in game.board if c == 'O')
+            x_count = game.board.count('X')
+            o_count = game.board.count('O')
             self.assertLessEqual(x_count, 3)
             self.assertLessEqual(o_count, 3)
 
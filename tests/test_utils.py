@@ -1,10 +1,7 @@
 """Unit tests for utils.py"""
 
+import re
 import unittest
-import sys
-import os
-
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils import (
     Difficulty, 
@@ -16,6 +13,9 @@ from utils import (
     get_cell_color
 )
 
+# Matches a full #rrggbb hex color; compiled once for the color checks
+_HEX_RE = re.compile(r'#[0-9a-fA-F]{6}').fullmatch
+
 
 class TestDifficulty(unittest.TestCase):
     """Tests for Difficulty enum."""
@@ -57,7 +57,7 @@ class TestColors(unittest.TestCase):
         """All colors should be valid hex codes."""
         for name, color in COLORS.items():
             self.assertTrue(
-                color.startswith('#') and len(color) == 7,
+                _HEX_RE(color),
                 f"{name} is not a valid hex color: {color}"
             )
 
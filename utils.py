@@ -6,13 +6,18 @@ the Tic Tac Toe game. It centralizes common values and helper
 functions to maintain consistency and reduce code duplication.
 """
 
+import sys
 from enum import Enum
+from types import MappingProxyType
 from typing import Dict
 
 
-class GameMode(Enum):
+class GameMode(str, Enum):
     """
     Enumeration of available game modes.
+
+    str mixin so members compare and hash directly as their value
+    (GameMode.NORMAL == "normal") without Enum.__eq__ dispatch.
     """
     NORMAL = "normal"
     NO_DRAW = "no_draw"
@@ -31,7 +36,7 @@ GAME_MODE_DESCRIPTIONS: Dict[GameMode, str] = {
 }
 
 
-class Difficulty(Enum):
+class Difficulty(str, Enum):
     """
     Enumeration of available difficulty levels.
     
@@ -102,15 +107,39 @@ FONTS = {
 }
 
 
+# Both possible outputs, built once
+_PLAYER_LABEL: Dict[str, str] = {
+    'X': 'X (You)',
+    'O': 'O (Computer)',
+}
+
+
 def format_player_symbol(player: str) -> str:
     """Return formatted player name."""
-    return 'X (You)' if player == 'X' else 'O (Computer)'
+    return _PLAYER_LABEL.get(player, _PLAYER_LABEL['O'])
+
+
+# Cell colors resolved once; the helper runs on every cell redraw
+_CELL_COLOR: Dict[str, str] = {
+    'X': COLORS['player_x'],
+    'O': COLORS['player_o'],
+}
+_DEFAULT_CELL_COLOR = COLORS['text_primary']
 
 
 def get_cell_color(value: str) -> str:
     """Return color for cell value (X, O, or empty)."""
-    if value == 'X':
-        return COLORS['player_x']
-    elif value == 'O':
-        return COLORS['player_o']
-    return COLORS['text_primary']
+    return _CELL_COLOR.get(value, _DEFAULT_CELL_COLOR)
+
+
+# ── Freeze shared lookup tables ─────────────────────────────────────
+# These dicts are read-only by convention; a MappingProxyType makes
+# accidental mutation fail fast instead of silently corrupting shared
+# state. String keys are interned so hot lookups (COLORS[...] on every
+# redraw) short-circuit on pointer identity before string comparison.
+COLORS = MappingProxyType({sys.intern(k): v for k, v in COLORS.items()})
+FONTS = MappingProxyType({sys.intern(k): v for k, v in FONTS.items()})
+GAME_MODE_NAMES = MappingProxyType(GAME_MODE_NAMES)
+GAME_MODE_DESCRIPTIONS = MappingProxyType(GAME_MODE_DESCRIPTIONS)
+DIFFICULTY_NAMES = MappingProxyType(DIFFICULTY_NAMES)
+DIFFICULTY_DESCRIPTIONS = MappingProxyType(DIFFICULTY_DESCRIPTIONS)